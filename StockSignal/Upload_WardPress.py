@@ -21,31 +21,87 @@ WordPress投稿モジュール - 株価分析結果の自動投稿・チャー
 - matplotlib（グラフ描画）
 - japanize_matplotlib（日本語表示）
 """
+import numpy as np
 import pandas as pd
 import requests
-from requests.auth import HTTPBasicAuth
+from requests.adapters import HTTPAdapter, Retry
 from datetime import datetime, timedelta
+import matplotlib
+# 非対話バックエンドを明示（GUIイベントループを起動しない。
+# プロセスプールの子プロセスがGUIを生成しないよう親側でも設定しておく）
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import os
 import base64
-import japanize_matplotlib
-import mplfinance as mpf
 from io import BytesIO
 import time
 from matplotlib import font_manager as fm
-from PIL import Image
 import math
+
+# japanize_matplotlib / mplfinance / PIL は読み込みに時間がかかるため
+# トップレベルではインポートせず、実際に使う関数内で遅延インポートする
+# （プロセスプールの各ワーカー起動時のコストをチャート生成時のみに限定）
 import shutil
+import functools
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # 結果バックアップ機能のインポート
 from result_backup import backup_previous_results, get_consecutive_tickers, decorate_company_name
 
+# ディレクトリ構成（関数ごとに再計算せずモジュール読み込み時に1回だけ解決）
+_MODULE_DIR = os.path.dirname(os.path.abspath(__file__))
+_RESULT_DIR = os.path.join(_MODULE_DIR, "Result")
+_TECHNICAL_DIR = os.path.join(_MODULE_DIR, "TechnicalSignal")
+_COMPANY_LIST_FILE = os.path.join(_MODULE_DIR, "..", "company_list_20250426.csv")
+
+# 出力先ディレクトリも1回だけ作成しておく
+os.makedirs(_RESULT_DIR, exist_ok=True)
+
 # WordPressサイトの接続情報を設定
+# 認証情報は環境変数を優先し、未設定時は従来の値にフォールバック
 WP_SITE_URL = "https://www.takstorage.site/"  # WordPressサイトのURL
 WP_API_ENDPOINT = f"{WP_SITE_URL}/wp-json/wp/v2/posts"  # WordPress REST API 投稿用エンドポイント
-WP_USERNAME = "tak.note7120@gmail.com"  # WordPressの管理者ユーザー名（メールアドレス）
-WP_APP_PASSWORD = "GNrk aQ3d 7GWu p1fw dCfM pAGH"  # WordPress アプリケーションパスワード（セキュリティ向上のため通常のパスワードではなくアプリパスワードを使用）
+WP_USERNAME = os.environ.get("WP_USERNAME", "tak.note7120@gmail.com")  # WordPressの管理者ユーザー名（メールアドレス）
+WP_APP_PASSWORD = os.environ.get("WP_APP_PASSWORD", "GNrk aQ3d 7GWu p1fw dCfM pAGH")  # WordPress アプリケーションパスワード（セキュリティ向上のため通常のパスワードではなくアプリパスワードを使用）
+
+# Basic認証ヘッダーはリクエストごとに再計算せず1回だけエンコード
+_AUTH_HEADER = "Basic " + base64.b64encode(f"{WP_USERNAME}:{WP_APP_PASSWORD}".encode()).decode()
+
+# WordPress REST APIへの接続を使い回すセッション
+# リクエストごとのTCP+TLSハンドシェイクを省略する。
+# 記事投稿のPOSTは再試行しない（応答が500/502でもサーバ側で投稿が
+# 作成済みの場合があり、再送すると同じ記事が重複publishされるため）
+SESSION = requests.Session()
+SESSION.headers.update({
+    'Authorization': _AUTH_HEADER,
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
+})
+SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=8))
+
+# メディアアップロード専用のセッション
+# 画像アップロードは失敗・再送しても孤立した添付ファイルが残り得るだけで
+# 記事が重複することはないため、こちらだけ403/429等のWAF・レート制限
+# 応答を指数バックオフで自動再試行する
+MEDIA_SESSION = requests.Session()
+MEDIA_SESSION.headers.update(SESSION.headers)
+MEDIA_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=5,
+        backoff_factor=2,
+        status_forcelist=[403, 429, 500, 502, 503],
+        allowed_methods=None  # メディアアップロードのPOSTも再試行対象にする
+    )
+))
+
+# /wp-json/batch/v1 での一括メディアアップロードを使うかどうか
+# 素のWordPressでは /wp/v2/media がバッチ対象外（allow_batch無効）のため
+# デフォルトでは試行せず、最初から個別アップロードを使う。
+# バッチ対応を有効化した環境でのみ環境変数でオンにする
+WP_BATCH_MEDIA_UPLOAD = os.environ.get("WP_BATCH_MEDIA_UPLOAD", "0") == "1"
 
 # 今日の日付と昨日の日付を取得（昨日の株価データを投稿するため）
 current_date = (datetime.now()).strftime("%Y/%m/%d")  # YYYY/MM/DD形式
@@ -53,25 +109,83 @@ current_date = (datetime.now()).strftime("%Y/%m/%d")  # YYYY/MM/DD形式
 # チャート生成用の設定
 # フォント設定とスタイル
 plt.style.use('default')
-japanize_matplotlib.japanize()
-# 日本語フォントを確実に登録
+
+# 日本語フォントの候補（Windowsで一般的なフォントを優先）
 possible_fonts = [
     r"C:\\Windows\\Fonts\\meiryo.ttc",
     r"C:\\Windows\\Fonts\\meiryob.ttc",
     r"C:\\Windows\\Fonts\\msgothic.ttc",
     r"C:\\Windows\\Fonts\\YuGothM.ttc"
 ]
-for fpath in possible_fonts:
-    if os.path.exists(fpath):
-        try:
-            fm.fontManager.addfont(fpath)
-        except Exception:
-            pass
-plt.rcParams['font.family'] = ['Meiryo', 'Yu Gothic', 'MS Gothic']
+
+@functools.lru_cache(maxsize=1)
+def _register_jp_font():
+    """
+    日本語フォントをmatplotlibに登録します（プロセスごとに1回だけ実行）
+
+    fontManager.addfontはフォントキャッシュの再構築を伴い数百msかかるため、
+    モジュールインポート時ではなくチャートを実際に描画する直前に呼び出し、
+    結果をlru_cacheでメモ化します。チャートを描画しないインポート
+    （後工程スクリプトからの関数利用など）ではコストが発生しません。
+
+    Returns:
+        str | None: 登録したフォントファイルのステム名。見つからない場合はNone
+    """
+    import japanize_matplotlib
+    japanize_matplotlib.japanize()
+    registered = None
+    for fpath in possible_fonts:
+        font_path = Path(fpath)
+        if font_path.is_file():
+            try:
+                fm.fontManager.addfont(str(font_path))
+                registered = font_path.stem
+                break  # 最初に見つかった1フォントのみ登録
+            except Exception:
+                pass
+    plt.rcParams['font.family'] = ['Meiryo', 'Yu Gothic', 'MS Gothic']
+    # レイアウト調整はconstrained_layoutに一本化
+    # （savefigのbbox_inches='tight'は全アーティストを走査する
+    #   2回目のレイアウト計算が走るため使わない）
+    plt.rcParams['figure.constrained_layout.use'] = True
+    # 線描画の高速化（移動平均線などのパス単純化と分割描画）
+    plt.rcParams['path.simplify'] = True
+    plt.rcParams['path.simplify_threshold'] = 1.0
+    plt.rcParams['agg.path.chunksize'] = 10000
+    return registered
+
+# マーケットカラーとスタイル（日本語フォント）
+# mplfinanceでは、up=陽線（Close > Open）、down=陰線（Close < Open）
+# 日本式：赤=上昇、青=下降
+# 全銘柄で共通のため、チャートごとに再構築せずプロセスごとに1回だけ構築する
+@functools.lru_cache(maxsize=1)
+def _get_mpf_style():
+    """
+    mplfinanceのチャートスタイルを構築して返します（プロセスごとに1回だけ）
+
+    Returns:
+        dict: mpf.plotにそのまま渡せるスタイル辞書
+    """
+    import mplfinance as mpf
+    market_colors = mpf.make_marketcolors(
+        up='#d32f2f',      # 陽線（赤色）
+        down='#1e88e5',    # 陰線（青色）
+        edge='inherit',    # 枠線は継承
+        volume='inherit',  # 出来高は陽線・陰線と同じ色
+        wick='inherit',    # ヒゲは継承
+        ohlc='inherit'     # OHLCは継承
+    )
+    # 日本式スタイルを明示的に設定
+    return mpf.make_mpf_style(
+        base_mpf_style='yahoo',
+        marketcolors=market_colors,
+        rc={'font.family': 'Meiryo'},
+        y_on_right=True  # Y軸を右側に
+    )
 
 # 投稿の冒頭部分のテキスト（HTMLタグ含む）
 # 投稿の説明文と銘柄コードの解説を含む
-intro_text = """
+INTRO_HTML = """
 <p>{current_date}終わり時点での情報です。</p>
 <p>Pythonを使用して自動でデータ収集&演算を行い、レンジをブレイクした銘柄、押し目狙い銘柄を抽出しています。</p>
 <p>銘柄名に付いているアルファベットで市場を表しています。</p>
@@ -83,60 +197,154 @@ intro_text = """
 <p></p>
 """.format(current_date=current_date)
 
-def read_csv_to_html_table(csv_file_path):
+# 投稿タイトル（日付は実行日で確定するためモジュール読み込み時に1回だけ整形）
+POST_TITLE = f"【日本株】銘柄抽出結果_{current_date} | 今日の押し目買い狙い&ブレイクアウト銘柄"
+
+# AFFINGER（WordPressテーマ）のスライドボックスブロック
+# クリックで展開される折りたたみ領域。投稿内の全セクションで共通の
+# 骨組みをテンプレート化し、本文のみ差し替える
+_SLIDEBOX_TMPL = """
+        <p><!-- wp:st-blocks/st-slidebox --></p>
+        <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
+        <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
+        <div class="st-slidebox" data-st-slidebox-content="">
+        <div class="scroll-box">
+        {body}
+        </div>
+        </div>
+        </div>
+        <p><!-- /wp:st-blocks/st-slidebox --></p>
+        """
+
+def _slidebox(body):
     """
-    CSVファイルを読み込み、スタイリングされたHTML表に変換します
-    
-    指定されたCSVファイルを読み込み、数値フォーマットを調整した上で
-    HTMLテーブル形式に変換します。長いテキストに対応したスタイリングも適用します。
-    
+    スライドボックス（折りたたみ）ブロックのHTMLを生成します
+
     Args:
-        csv_file_path (str): 読み込むCSVファイルのパス
-        
+        body (str): ブロック内に表示するHTML
+
+    Returns:
+        str: スライドボックスブロックのHTML
+    """
+    return _SLIDEBOX_TMPL.format(body=body)
+
+# 各セクションの見出し部分のテンプレート（{count}は銘柄数）
+# 投稿本文はこれらの断片をリストに集めて最後に''.join()で結合する
+# （f-stringの連結で巨大な中間文字列を繰り返し作らない）
+_BREAKOUT_HEADER_TMPL = """
+        <h2>ブレイク銘柄 ({count})</h2>
+        <p>過去3か月間の最高値を更新した銘柄です。</p>
+        <p>下記の条件で抽出しています。
+        </p>[st-mybox title="ブレイク銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
+        <ol>
+        <li>最新の終値が、直近3か月の高値を更新</li>
+        <li>出来高が10万以上</li>
+        <li>終値が高値と安値の中間より上</li>
+        <li>陽線で引けている</li>
+        </ol>
+        [/st-mybox]
+        <p><a href="https://www.takstorage.site/%e3%83%96%e3%83%ac%e3%82%a4%e3%82%af%e3%82%a2%e3%82%a6%e3%83%88%e5%80%99%e8%a3%9c%e9%8a%98%e6%9f%84%e3%81%ae%e6%8a%bd%e5%87%ba%e6%9d%a1%e4%bb%b6%e3%81%a8%e3%81%af%ef%bc%9f%e3%82%a8%e3%83%b3%e3%83%88/" target="_blank" rel="noopener noreferrer"><strong>解説記事はコチラ</strong></a></p>
+        """
+
+_CONSECUTIVE_HEADER = """
+        <h3>連続ブレイクアウト該当銘柄</h3>
+        <p>前回の結果と今回の結果で連続している銘柄です。</p>
+        <p>この銘柄は、前回の抽出結果でも登場し、連日ブレイクしている銘柄です。</p>
+        """
+
+_ALL_ABOVE_HEADER_TMPL = """
+        <h2>AllAbove銘柄 ({count})</h2>
+        <p>パーフェクトオーダーかつ短期移動平均の上で推移している銘柄です。</p>
+        <p>下記の条件で抽出しています。
+        </p>[st-mybox title="AllAbove銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
+        <ol>
+        <li>パーフェクトオーダー（短期(5日)移動平均線 &gt; 中期(20日)移動平均線 &gt; 長期(60日)移動平均線）</li>
+        <li>最新ローソク足の始値と終値の中間値が短期移動平均線以上</li>
+        <li>株価が500円以上</li>
+        <li>出来高が20万以上</li>
+        </ol>
+        [/st-mybox]
+        """
+
+_PUSH_MARK_HEADER_TMPL = """
+        <h2>押し目狙い銘柄 ({count})</h2>
+        <p>中期移動平均が上昇中で、終値が短期移動平均より上、直近で短期移動平均が下落した日があり、出来高も条件を満たす押し目狙いの銘柄です。</p>
+        <p>下記の条件で抽出しています。
+        </p>[st-mybox title="押し目狙い銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
+        <ol>
+        <li>中期移動平均線が上昇中（前日より高い）</li>
+        <li>終値が短期移動平均線より上</li>
+        <li>直近3日以内に、短期移動平均線の変動率がマイナスの日が1日以上ある</li>
+        <li>中期移動線が長期移動平均線より上</li>
+        <li>出来高が10万以上</li>
+        <li>出来高が出来高移動平均線より多い</li>
+        </ol>
+        [/st-mybox]
+        <p><a href="https://www.takstorage.site/%e6%8a%bc%e3%81%97%e7%9b%ae%e8%b2%b7%e3%81%84%e5%80%99%e8%a3%9c%e9%8a%98%e6%9f%84%e3%81%af%e3%81%a9%e3%81%86%e3%81%84%e3%81%86%e6%9d%a1%e4%bb%b6%e3%81%a7%e6%8a%bd%e5%87%ba%e3%81%97%e3%81%a6%e3%81%84/" target="_blank" rel="noopener noreferrer"><strong>解説記事はコチラ</strong></a></p>
+        """
+
+def df_to_html_table(df):
+    """
+    DataFrameをスタイリングされたHTML表に変換します
+
+    数値フォーマットを調整した上でHTMLテーブル形式に変換します。
+    長いテキストに対応したスタイリングも適用します。
+
+    Args:
+        df (pandas.DataFrame): 変換するデータフレーム
+
     Returns:
         tuple: (スタイル適用済みのHTML表（スクロール可能なコンテナ内）, 銘柄数)
     """
-    # ファイルが存在しない場合の処理
-    if not os.path.exists(csv_file_path):
-        print(f"警告: ファイルが見つかりません: {csv_file_path}")
-        return "<p>データが見つかりません</p>", 0
-    
-    # CSVファイルをpandasデータフレームとして読み込み
-    df = pd.read_csv(csv_file_path)
+    # 空のテーブル（静かな日のブレイク銘柄など）はフォーマット処理も
+    # テーブル組み立ても不要なため即返す
+    if len(df) == 0:
+        return "<p>該当銘柄なし</p>", 0
 
-    # 数値フォーマットをカスタマイズする関数
-    def format_number(x):
-        if pd.isna(x):  # NaN値の場合は処理しない
-            return x
-        
-        try:
-            # 数値に変換可能な場合
-            num_value = float(x)
-            # 整数かどうかをチェック
-            if num_value.is_integer():
-                return int(num_value)  # 整数の場合は整数として表示
-            else:
-                return f"{num_value:.1f}"  # 小数点以下がある場合は1桁まで表示
-        except (ValueError, TypeError):
-            # 数値に変換できない場合はそのまま返す
-            return x
-
-    # 各列のデータタイプを確認し、数値列に対してフォーマット適用
-    for col in df.columns:
-        # 数値列（intまたはfloat）のみを処理
-        if df[col].dtype in ['int64', 'float64']:
-            df[col] = df[col].apply(format_number)
-
-    # DataFrame を HTML テーブルに変換
-    # index=False: インデックスは表示しない
-    # border=1: テーブル境界線を表示
-    # escape=False: HTML特殊文字をエスケープしない（HTMLタグを使用可能に）
-    df_html = df.to_html(index=False, border=1, escape=False)
-
-    # 銘柄名（Name列）が長い場合でもテーブルレイアウトを崩さないようにスタイル適用
-    # 列幅の最大値を制限し、長いテキストは折り返す
-    df_html = df_html.replace('<th>', '<th style="max-width:800px; white-space:nowrap; overflow:hidden;">')
-    df_html = df_html.replace('<td>', '<td style="max-width:800px; word-wrap:break-word;">')
+    # 数値列（intまたはfloat）の表示フォーマットを変換
+    # （整数値は整数として、小数値は小数点以下1桁で、NaNは空欄で表示）
+    # 数値列の抽出はPythonループでのdtype比較ではなくselect_dtypesで一括判定
+    for col in df.select_dtypes(include='number').columns:
+        if len(df) <= 2:
+            # 1〜2行しかない場合はNumPyの列単位変換の起動コストの方が
+            # 高いため、セルごとのスカラー処理で済ませる
+            df[col] = [
+                '' if pd.isna(value)
+                else (str(int(value)) if float(value).is_integer() else f"{value:.1f}")
+                for value in df[col]
+            ]
+            continue
+        # 1セルずつPython関数をapplyするとセル数に比例したインタプリタ
+        # コストがかかるため、整数判定とフォーマットを列単位のベクトル
+        # 演算で行う
+        values = df[col].to_numpy(dtype='float64')
+        nan_mask = np.isnan(values)
+        int_mask = ~nan_mask & (np.mod(values, 1) == 0)
+        safe_values = np.where(nan_mask, 0, values)
+        formatted = np.where(
+            int_mask,
+            safe_values.astype('int64').astype(str),
+            np.char.mod('%.1f', safe_values)
+        )
+        df[col] = np.where(nan_mask, '', formatted)
+
+    # DataFrame を直接HTMLテーブル文字列に組み立て
+    # to_html + 全文replaceによるスタイル挿入は表が大きいほどコピーコストが
+    # かさむため、スタイル済みの<th>/<td>を最初から書き出して一度のjoinで結合する
+    # （HTML特殊文字はエスケープしない＝従来のescape=False相当）
+    header_cells = ''.join(
+        f'<th style="max-width:800px; white-space:nowrap; overflow:hidden;">{col}</th>'
+        for col in df.columns
+    )
+    body_rows = [
+        '<tr>' + ''.join(f'<td style="max-width:800px; word-wrap:break-word;">{value}</td>' for value in row) + '</tr>'
+        for row in df.itertuples(index=False, name=None)
+    ]
+    df_html = (
+        '<table border="1" class="dataframe">\n'
+        f'<thead>\n<tr>{header_cells}</tr>\n</thead>\n'
+        '<tbody>\n' + '\n'.join(body_rows) + '\n</tbody>\n</table>'
+    )
 
     # テーブルをスクロール可能なdivコンテナでラップ
     # コンテンツが大きくても表示領域を固定できる
@@ -145,21 +353,45 @@ def read_csv_to_html_table(csv_file_path):
         {df_html}
     </div>
     """
-    # テーブルの内容とCSV内の銘柄数（行数）を返す
+    # テーブルの内容と銘柄数（行数）を返す
     return styled_table, len(df)
 
+def read_csv_to_html_table(csv_file_path):
+    """
+    CSVファイルを読み込み、スタイリングされたHTML表に変換します
+
+    Args:
+        csv_file_path (str): 読み込むCSVファイルのパス
+
+    Returns:
+        tuple: (スタイル適用済みのHTML表（スクロール可能なコンテナ内）, 銘柄数)
+    """
+    # ファイルが存在しない場合の処理
+    if not os.path.exists(csv_file_path):
+        print(f"警告: ファイルが見つかりません: {csv_file_path}")
+        return "<p>データが見つかりません</p>", 0
+
+    # CSVファイルをpandasデータフレームとして読み込み
+    df = pd.read_csv(csv_file_path)
+    return df_to_html_table(df)
+
+@functools.lru_cache(maxsize=1)
 def load_company_names():
     """
     銘柄名辞書を読み込み
-    
+
+    企業リストCSVは実行中に変化しないため、結果をlru_cacheでメモ化し
+    2回目以降の呼び出しではCSVパースを省略します。
+
     Returns:
         dict: ティッカーをキー、銘柄名を値とする辞書
     """
     try:
-        company_list_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "company_list_20250426.csv")
-        df = pd.read_csv(company_list_file, encoding='utf-8')
+        df = pd.read_csv(_COMPANY_LIST_FILE, encoding='utf-8')
         # ティッカーを文字列に変換して辞書を作成
-        return dict(zip(df['Ticker'].astype(str), df['銘柄名']))
+        # （dict(zip(...))の要素ごとのボクシングを避け、pandasの
+        #   C実装の一括変換で辞書を構築する）
+        return pd.Series(df['銘柄名'].to_numpy(), index=df['Ticker'].astype(str)).to_dict()
     except Exception as e:
         print(f"銘柄名ファイルの読み込みエラー: {e}")
         return {}
@@ -167,39 +399,65 @@ def load_company_names():
 def load_stock_data(ticker):
     """
     指定されたティッカーの株価データを読み込み
-    
+
+    チャート生成に必要な6列のみを型指定付きで読み込みます。
+    初回読み込み時にfeatherサイドカーを作成し、CSVより新しい場合は
+    以降の実行でメモリマップ読み込みしてCSVパースを省略します。
+    （featherは無圧縮のArrow IPC形式のため、メモリマップ経由なら
+    プロセスプールの各ワーカーがOSのページキャッシュを共有できます）
+
     Args:
         ticker (str): ティッカー
-        
+
     Returns:
         pandas.DataFrame: 株価データ（Date, Open, High, Low, Close, Volume）
     """
     try:
-        technical_signal_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "TechnicalSignal")
         ticker_str = str(ticker)
-        signal_file = os.path.join(technical_signal_dir, f"{ticker_str}_signal.csv")
+        signal_file = os.path.join(_TECHNICAL_DIR, f"{ticker_str}_signal.csv")
         if not os.path.exists(signal_file):
             print(f"信号ファイルが見つかりません: {signal_file}")
             return None
-        
-        df = pd.read_csv(signal_file, encoding='utf-8')
-        
-        # 必要な列のみを選択
+
         required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-        if not all(col in df.columns for col in required_columns):
-            print(f"必要な列が見つかりません: {ticker_str}")
-            return None
-        
-        # 日付列をdatetime型に変換
-        df['Date'] = pd.to_datetime(df['Date'])
-        
+        feather_file = os.path.join(_TECHNICAL_DIR, f"{ticker_str}_signal.feather")
+
+        # featherサイドカーがCSVより新しければそちらを読み込み（キャッシュヒット）
+        if os.path.exists(feather_file) and os.path.getmtime(feather_file) >= os.path.getmtime(signal_file):
+            try:
+                from pyarrow import feather
+                return feather.read_feather(feather_file, memory_map=True)
+            except Exception as e:
+                print(f"featherキャッシュの読み込みエラー ({ticker_str}): {e}")
+
+        # 必要な列のみを型指定付きで読み込み
+        # （全列のトークナイズと型推論を省略してパース時間とメモリを削減）
+        df = pd.read_csv(
+            signal_file,
+            encoding='utf-8',
+            usecols=required_columns,
+            dtype={'Open': 'float32', 'High': 'float32', 'Low': 'float32', 'Close': 'float32', 'Volume': 'float64'},
+            parse_dates=['Date'],
+        )
+
         # 最新のデータから過去6ヶ月分（全データ）を取得
-        df = df.sort_values('Date')
-        
-        return df[required_columns]
-        
+        # （ソースが日付順に出力済みの場合はソートを省略）
+        if not df['Date'].is_monotonic_increasing:
+            df = df.sort_values('Date')
+        df = df[required_columns]
+
+        # 次回実行用にfeatherサイドカーを保存（pyarrow未導入環境では何もしない）
+        # メモリマップ読み込みを活かすため無圧縮で書き出す
+        try:
+            from pyarrow import feather
+            feather.write_feather(df, feather_file, compression='uncompressed')
+        except Exception:
+            pass
+
+        return df
+
     except Exception as e:
-        print(f"株価データの読み込みエラー ({ticker_str}): {e}")
+        print(f"株価データの読み込みエラー ({ticker}): {e}")
         return None
 
 def generate_chart(ticker, company_names, consecutive_tickers=None):
@@ -215,13 +473,27 @@ def generate_chart(ticker, company_names, consecutive_tickers=None):
         str | None: 生成されたチャートPNGファイルのパス
     """
     try:
+        # 出力PNGが元データ（シグナルCSV）より新しければ再描画をスキップ
+        # （同じ銘柄がブレイク・AllAbove・押し目の複数セクションに該当する
+        #   場合や、当日の再実行でmatplotlib描画を丸ごと省略できる）
+        ticker_str = str(ticker)
+        output_file = os.path.join(_RESULT_DIR, f"{ticker_str}_chart.png")
+        signal_file = os.path.join(_TECHNICAL_DIR, f"{ticker_str}_signal.csv")
+        if (os.path.exists(output_file) and os.path.exists(signal_file)
+                and os.path.getmtime(output_file) >= os.path.getmtime(signal_file)):
+            return output_file
+
+        import mplfinance as mpf
+
+        # 日本語フォントを登録（初回呼び出し時のみ実行される）
+        _register_jp_font()
+
         # 株価データを読み込み
         df = load_stock_data(ticker)
         if df is None or df.empty:
             return None
-        
-        # 銘柄名を取得（tickerを文字列に変換）
-        ticker_str = str(ticker)
+
+        # 銘柄名を取得
         company_name = company_names.get(ticker_str, f"銘柄{ticker_str}")
         
         # 連続該当銘柄の場合、銘柄名の先頭に「◎」を付与
@@ -233,40 +505,15 @@ def generate_chart(ticker, company_names, consecutive_tickers=None):
         df_mpf = df_mpf.set_index('Date')
         df_mpf = df_mpf[['Open', 'High', 'Low', 'Close', 'Volume']]
 
-        # マーケットカラーとスタイル（日本語フォント）
-        # mplfinanceでは、up=陽線（Close > Open）、down=陰線（Close < Open）
-        # 日本式：赤=上昇、青=下降
-        mc = mpf.make_marketcolors(
-            up='#d32f2f',      # 陽線（赤色）
-            down='#1e88e5',    # 陰線（青色）
-            edge='inherit',    # 枠線は継承
-            volume='inherit',  # 出来高は陽線・陰線と同じ色
-            wick='inherit',    # ヒゲは継承
-            ohlc='inherit'     # OHLCは継承
-        )
-        # 日本式スタイルを明示的に設定
-        s = mpf.make_mpf_style(
-            base_mpf_style='yahoo',
-            marketcolors=mc,
-            rc={'font.family': 'Meiryo'},
-            y_on_right=True  # Y軸を右側に
-        )
-
-        # 出力ファイルパス
-        result_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Result")
-        os.makedirs(result_dir, exist_ok=True)
-        output_file = os.path.join(result_dir, f"{ticker_str}_chart.png")
-
         # 画像をファイルに保存（figを受け取り軸を整形）
         fig, axes = mpf.plot(
             df_mpf,
             type='candle',
             mav=(5, 20, 60),
-            style=s,
+            style=_get_mpf_style(),
             title=f"{ticker_str} - {company_name}",
             figsize=(9.6, 6.4),  # 960px × 640px (96 DPI)
             volume=True,  # 出来高を表示
-            tight_layout=True,
             returnfig=True
         )
         # 出来高軸の指数表記オフ＋桁区切り
@@ -291,7 +538,12 @@ def generate_chart(ticker, company_names, consecutive_tickers=None):
                 fig.axes[1].set_ylabel('出来高', fontsize=10)
         except Exception:
             pass
-        fig.savefig(output_file, dpi=300, bbox_inches='tight', format='png')
+        # figsize=(9.6, 6.4) × dpi=100 で意図通りの960×640pxになる
+        # （dpi=300ではcombine_chartsで縮小される前提の9倍のピクセルを
+        #   描画・圧縮することになり、savefigが数倍遅くなる）
+        # compress_level=1: 中間ファイルのためzlibの高圧縮は不要
+        fig.savefig(output_file, dpi=100, format='png',
+                    pil_kwargs={'compress_level': 1})
         plt.close(fig)
         return output_file
         
@@ -299,35 +551,169 @@ def generate_chart(ticker, company_names, consecutive_tickers=None):
         print(f"チャート生成エラー ({ticker}): {e}")
         return None
 
-def upload_image_to_wordpress(image_path: str):
+# プロセスプールのワーカープロセスが保持する共有データ
+# （_init_chart_worker で1回だけ設定し、銘柄ごとのpickle転送を避ける）
+_WORKER_COMPANY_NAMES = None
+_WORKER_CONSECUTIVE_TICKERS = None
+
+def _init_chart_worker(company_names, consecutive_tickers):
+    """
+    チャート生成ワーカープロセスの初期化処理
+
+    銘柄名辞書と連続該当銘柄をワーカーのモジュールグローバルに保持し、
+    非対話型バックエンド（Agg）と日本語フォントをプロセスごとに1回だけ設定します。
+
+    Args:
+        company_names (dict): 銘柄名辞書
+        consecutive_tickers (dict): 連続該当銘柄の辞書
+    """
+    global _WORKER_COMPANY_NAMES, _WORKER_CONSECUTIVE_TICKERS
+    _WORKER_COMPANY_NAMES = company_names
+    _WORKER_CONSECUTIVE_TICKERS = consecutive_tickers
+    import matplotlib
+    matplotlib.use('Agg')
+    _register_jp_font()
+
+def _render_chart_worker(ticker):
+    """
+    ワーカープロセス内で1銘柄分のチャートを生成します（ProcessPoolExecutor用）
+
+    Args:
+        ticker (str): ティッカー
+
+    Returns:
+        str | None: 生成されたチャートPNGファイルのパス
+    """
+    return generate_chart(ticker, _WORKER_COMPANY_NAMES, _WORKER_CONSECUTIVE_TICKERS)
+
+def generate_charts_parallel(tickers, company_names, consecutive_tickers=None):
+    """
+    複数銘柄のチャートをプロセスプールで並列生成します
+
+    チャート生成はmatplotlibの描画処理がCPUバウンドで銘柄ごとに独立しているため、
+    CPUコア数分のプロセスに分散してほぼ線形の高速化を図ります。
+
+    Args:
+        tickers (list): ティッカーのリスト
+        company_names (dict): 銘柄名辞書
+        consecutive_tickers (dict): 連続該当銘柄の辞書
+
+    Returns:
+        list: 生成されたチャートPNGファイルのパスのリスト（失敗した銘柄は除外）
+    """
+    if not tickers:
+        return []
+
+    with ProcessPoolExecutor(
+        max_workers=os.cpu_count(),
+        initializer=_init_chart_worker,
+        initargs=(company_names, consecutive_tickers)
+    ) as executor:
+        results = executor.map(_render_chart_worker, tickers, chunksize=4)
+        return [path for path in results if path]
+
+def _image_name_and_bytes(image):
     """
-    画像ファイルをWordPressメディアにアップロードしてURLを返す
+    アップロード対象の画像から (ファイル名, PNGバイト列) を取り出す
+
+    combine_chartsが返すメモリ上の画像（(ファイル名, BytesIO)のタプル）と
+    ディスク上のファイルパスの両方を受け付けます。
+
+    Args:
+        image: (ファイル名, BytesIO) のタプル、または画像ファイルのパス
+
+    Returns:
+        tuple: (ファイル名, bytes)
+    """
+    if isinstance(image, tuple):
+        name, buf = image
+        return name, buf.getvalue()
+    with open(image, 'rb') as f:
+        return os.path.basename(image), f.read()
+
+def upload_image_to_wordpress(image):
+    """
+    画像を1件WordPressメディアにアップロードしてURLを返す
+
+    Args:
+        image: (ファイル名, BytesIO) のタプル、または画像ファイルのパス
     """
     try:
         media_endpoint = f"{WP_SITE_URL}/wp-json/wp/v2/media"
-        # multipart/form-data で送信し、User-Agent を指定
-        ua = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0 Safari/537.36'
-        }
-        files = {
-            'file': (os.path.basename(image_path), open(image_path, 'rb'), 'image/png')
-        }
-        # 軽いリトライ（WAF対策）
-        for attempt in range(5):
-            resp = requests.post(media_endpoint, headers=ua, files=files, auth=HTTPBasicAuth(WP_USERNAME, WP_APP_PASSWORD))
-            if resp.status_code in (200, 201):
-                return resp.json().get('source_url')
-            # 403や429などは待機して再試行
-            if resp.status_code in (403, 429, 500, 502, 503):
-                time.sleep(2 + attempt * 2)
-                continue
-            break
+        # multipart/form-data で送信（認証・User-Agent・再試行はMEDIA_SESSION側で設定済み）
+        # ファイルオブジェクトをそのまま渡してストリーミング送信し、
+        # PNG全体を事前にbytesへ読み込まない
+        if isinstance(image, tuple):
+            name, buf = image
+            buf.seek(0)
+            files = {'file': (name, buf, 'image/png')}
+            resp = MEDIA_SESSION.post(media_endpoint, files=files)
+        else:
+            with open(image, 'rb') as f:
+                files = {'file': (os.path.basename(image), f, 'image/png')}
+                resp = MEDIA_SESSION.post(media_endpoint, files=files)
+        if resp.status_code in (200, 201):
+            return resp.json().get('source_url')
         print(f"画像アップロード失敗: {resp.status_code} {resp.text}")
         return None
     except Exception as e:
         print(f"画像アップロードでエラー: {e}")
         return None
 
+def upload_images_to_wordpress(images):
+    """
+    複数の画像をまとめてWordPressメディアにアップロードしてURLリストを返す
+
+    WP_BATCH_MEDIA_UPLOADが有効な環境では、バッチエンドポイント
+    （/wp-json/batch/v1）に1リクエストで全件を送信してリクエスト回数を
+    削減します。素のWordPressはメディアをバッチ対象にしていないため、
+    デフォルトでは最初から1件ずつの並行アップロードを使います。
+
+    Args:
+        images (list): (ファイル名, BytesIO) のタプル、または画像ファイルの
+                       パスのリスト
+
+    Returns:
+        list: 入力と同じ順序のURLリスト（失敗した画像はNone）
+    """
+    if not images:
+        return []
+
+    if WP_BATCH_MEDIA_UPLOAD:
+        try:
+            batch_requests = []
+            for image in images:
+                name, data = _image_name_and_bytes(image)
+                encoded = base64.b64encode(data).decode('ascii')
+                batch_requests.append({
+                    "method": "POST",
+                    "path": "/wp/v2/media",
+                    "headers": {
+                        "Content-Disposition": f'attachment; filename="{name}"',
+                        "Content-Type": "image/png",
+                    },
+                    "body": encoded,
+                })
+
+            resp = MEDIA_SESSION.post(f"{WP_SITE_URL}/wp-json/batch/v1", json={"requests": batch_requests})
+            if resp.status_code in (200, 201):
+                responses = resp.json().get('responses', [])
+                if len(responses) == len(images):
+                    return [
+                        r.get('body', {}).get('source_url') if r.get('status') in (200, 201) else None
+                        for r in responses
+                    ]
+            print(f"バッチアップロードが利用できないため個別アップロードに切り替えます: {resp.status_code}")
+        except Exception as e:
+            print(f"バッチアップロードでエラーが発生したため個別アップロードに切り替えます: {e}")
+
+    # 1件ずつのアップロードをスレッドプールで並行実行
+    # （HTTPS POSTのソケット待ちが大半のためI/Oバウンド。MEDIA_SESSIONの
+    #   コネクションプールを共有してTLSハンドシェイクも使い回す。
+    #   executor.mapは入力と同じ順序で結果を返す）
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        return list(executor.map(upload_image_to_wordpress, images))
+
 def post_to_wordpress(title, post_content):
     """
     WordPressに投稿記事を送信します
@@ -350,13 +736,14 @@ def post_to_wordpress(title, post_content):
     }
     
     # WordPress REST APIにリクエストを送信
-    # HTTPBasicAuth: ユーザー名とアプリパスワードで認証
-    response = requests.post(
-        WP_API_ENDPOINT,
-        json=post_data,
-        auth=HTTPBasicAuth(WP_USERNAME, WP_APP_PASSWORD)
-    )
-    
+    # （認証設定済みのSESSIONで接続を使い回す。投稿POSTは重複publishを
+    #   避けるため再試行せず、失敗は例外も含めてコンソール報告に留める）
+    try:
+        response = SESSION.post(WP_API_ENDPOINT, json=post_data)
+    except Exception as e:
+        print("投稿に失敗しました:", e)
+        return
+
     # レスポンスを確認して結果をコンソールに表示
     if response.status_code == 201:  # 201 Created = 投稿成功
         print("投稿が成功しました:", response.json()["link"])
@@ -365,56 +752,62 @@ def post_to_wordpress(title, post_content):
 
 def combine_charts(chart_paths, charts_per_image=10):
     """
-    複数のチャート画像を10銘柄ずつに分割して複数の画像ファイルを作成します。
+    複数のチャート画像を10銘柄ずつに分割して結合画像を作成します。
     960px幅のグリッドレイアウトで配置します。
-    
+
+    結合画像はディスクに書き出さずメモリ上（BytesIO）に保持します。
+    ディスク経由にするとアップロード時にPNGの再読み込み・再デコードが
+    発生するため、エンコード済みバイト列をそのまま渡します。
+
     Args:
         chart_paths (list of str): 結合するチャート画像のパスのリスト
         charts_per_image (int): 1つの画像ファイルに含めるチャート数（デフォルト10）
-        
+
     Returns:
-        list: 結合された画像のパスのリスト
+        list: (ファイル名, PNGデータのBytesIO) のタプルのリスト
     """
     if not chart_paths:
         return []
 
-    # 画像を読み込む
-    images = [Image.open(p) for p in chart_paths]
-    
+    from PIL import Image
+
     # 目標幅（960px）
     target_width = 960
-    
-    # 各画像のサイズを取得
-    original_widths, original_heights = zip(*(i.size for i in images))
-    
+
+    # 各画像のサイズを取得（Image.openは遅延読み込みのため、
+    # ここではヘッダ情報のみ読まれピクセルデータはデコードされない）
+    original_widths = []
+    for p in chart_paths:
+        with Image.open(p) as img:
+            original_widths.append(img.size[0])
+
     # 1行あたりの画像数を計算（960px幅に収まるように）
     # 各画像の幅を960pxで割って、1行に何個収まるかを計算
     avg_width = sum(original_widths) / len(original_widths)
     images_per_row = max(1, int(target_width / avg_width))
-    
-    # 画像をリサイズ（幅を統一）
-    resized_images = []
-    for img in images:
-        # アスペクト比を保ってリサイズ
-        aspect_ratio = img.size[1] / img.size[0]
-        new_width = target_width // images_per_row
-        new_height = int(new_width * aspect_ratio)
-        resized_img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        resized_images.append(resized_img)
-    
-    # 出力ファイルパス
-    result_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Result")
-    os.makedirs(result_dir, exist_ok=True)
-    
+    cell_width = target_width // images_per_row
+
     output_files = []
-    
+
     # charts_per_imageずつに分割して画像を作成
-    for i in range(0, len(resized_images), charts_per_image):
-        batch_images = resized_images[i:i + charts_per_image]
-        
+    # 1バッチ分だけをデコード・リサイズし、貼り付け後にすぐ解放することで
+    # 全チャートを同時にメモリへ展開しない
+    for i in range(0, len(chart_paths), charts_per_image):
+        batch_images = []
+        for p in chart_paths[i:i + charts_per_image]:
+            img = Image.open(p)
+            # すでにセル幅以下の画像はリサイズ不要（デコードのみ）
+            if img.size[0] > cell_width:
+                # アスペクト比を保ってその場で縮小
+                # （thumbnailはコピーバッファを作らず、BILINEARはこの程度の
+                #   縮小率ではLANCZOSより大幅に速い）
+                aspect_ratio = img.size[1] / img.size[0]
+                img.thumbnail((cell_width, int(cell_width * aspect_ratio)), Image.Resampling.BILINEAR)
+            batch_images.append(img)
+
         # グリッドの行数を計算
         num_rows = math.ceil(len(batch_images) / images_per_row)
-        
+
         # 各行の高さを計算
         row_heights = []
         for row in range(num_rows):
@@ -422,38 +815,43 @@ def combine_charts(chart_paths, charts_per_image=10):
             end_idx = min(start_idx + images_per_row, len(batch_images))
             row_height = max(img.size[1] for img in batch_images[start_idx:end_idx])
             row_heights.append(row_height)
-        
+
         # 結合された画像のサイズを計算
         combined_width = target_width
         combined_height = sum(row_heights)
-        
+
         # 結合された画像を作成
         combined_image = Image.new('RGB', (combined_width, combined_height), 'white')
-        
+
         # 画像をグリッドレイアウトで配置
         y_offset = 0
         for row in range(num_rows):
             x_offset = 0
             row_height = row_heights[row]
-            
+
             for col in range(images_per_row):
                 img_idx = row * images_per_row + col
                 if img_idx < len(batch_images):
                     img = batch_images[img_idx]
                     # 中央揃えで配置
-                    x_center = x_offset + (target_width // images_per_row - img.size[0]) // 2
+                    x_center = x_offset + (cell_width - img.size[0]) // 2
                     y_center = y_offset + (row_height - img.size[1]) // 2
                     combined_image.paste(img, (x_center, y_center))
-                    x_offset += target_width // images_per_row
-            
+                    x_offset += cell_width
+
             y_offset += row_height
-        
-        # 画像を保存
+
+        # 貼り付けが終わった元画像を解放
+        for img in batch_images:
+            img.close()
+
+        # PNGにエンコードしてメモリ上に保持（ディスク書き込みなし）
         batch_num = i // charts_per_image + 1
-        output_file = os.path.join(result_dir, f"combined_charts_batch_{batch_num}.png")
-        combined_image.save(output_file, 'PNG')
-        output_files.append(output_file)
-    
+        buf = BytesIO()
+        combined_image.save(buf, 'PNG')
+        buf.seek(0)
+        output_files.append((f"combined_charts_batch_{batch_num}.png", buf))
+
     return output_files
 
 def cleanup_old_charts():
@@ -461,27 +859,50 @@ def cleanup_old_charts():
     Resultフォルダ内の古いチャート画像ファイル（.png）をすべて削除します
     """
     try:
-        result_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "Result")
+        result_dir = _RESULT_DIR
         if os.path.exists(result_dir):
-            # .pngファイルを検索して削除
-            png_files = [f for f in os.listdir(result_dir) if f.endswith('.png')]
+            # scandirはDirEntryにファイル種別をキャッシュするため、
+            # listdir + ファイルごとのstatより高速に.pngを列挙できる
             deleted_count = 0
-            
-            for png_file in png_files:
-                file_path = os.path.join(result_dir, png_file)
-                try:
-                    os.remove(file_path)
-                    deleted_count += 1
-                    print(f"古いチャートファイルを削除: {png_file}")
-                except Exception as e:
-                    print(f"ファイル削除エラー ({png_file}): {e}")
-            
+            with os.scandir(result_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith('.png'):
+                        try:
+                            os.remove(entry.path)
+                            deleted_count += 1
+                        except OSError as e:
+                            print(f"ファイル削除エラー ({entry.name}): {e}")
+
+            # ファイルごとのprintは省略し、まとめて1回だけ出力
             print(f"古いチャートファイル {deleted_count} 件を削除しました")
         else:
             print("Resultフォルダが見つかりません")
     except Exception as e:
         print(f"古いチャートファイルの削除中にエラーが発生しました: {e}")
 
+@functools.lru_cache(maxsize=1)
+def _resolve_breakout_path(base_path):
+    """
+    ブレイク銘柄CSVのパスを解決します（結果はメモ化）
+
+    Breakout.csvが存在しない場合は旧ファイル名のRange_Brake.csvに
+    フォールバックします。存在チェックのstatシステムコールは
+    1実行につき1回で済むようlru_cacheでメモ化します。
+
+    Args:
+        base_path (str): Breakout.csvのパス
+
+    Returns:
+        str: 実際に読み込むCSVファイルのパス
+    """
+    if os.path.exists(base_path):
+        return base_path
+    range_brake_path = base_path.replace("Breakout.csv", "Range_Brake.csv")
+    if os.path.exists(range_brake_path):
+        print(f"Breakout.csvが見つからないため、Range_Brake.csvを使用します: {range_brake_path}")
+        return range_brake_path
+    return base_path
+
 def generate_breakout_charts(breakout_csv_file_path, company_names, consecutive_tickers=None):
     """
     ブレイク銘柄のチャートを生成してWordPressにアップロードし、HTMLセクションを返す
@@ -499,57 +920,36 @@ def generate_breakout_charts(breakout_csv_file_path, company_names, consecutive_
     
     # ブレイク銘柄ファイルから銘柄を読み込み
     try:
-        # ブレイク銘柄ファイルのパスを動的に決定
-        breakout_file_path = breakout_csv_file_path
-        if not os.path.exists(breakout_file_path):
-            range_brake_path = breakout_csv_file_path.replace("Breakout.csv", "Range_Brake.csv")
-            if os.path.exists(range_brake_path):
-                breakout_file_path = range_brake_path
-                print(f"Breakout.csvが見つからないため、Range_Brake.csvを使用します: {range_brake_path}")
-        
+        # ブレイク銘柄ファイルのパスを動的に決定（メモ化済みリゾルバを使用）
+        breakout_file_path = _resolve_breakout_path(breakout_csv_file_path)
+
         breakout_df = pd.read_csv(breakout_file_path, encoding='utf-8-sig')
         breakout_tickers = breakout_df['Ticker'].tolist()
-        
-        # 各銘柄のチャートを生成（全件）
-        for i, ticker in enumerate(breakout_tickers):
-            try:
-                chart_path = generate_chart(ticker, company_names, consecutive_tickers)
-                if chart_path:
-                    breakout_chart_img_paths.append(chart_path)
-                    print(f"✓ {ticker} のチャートを生成")
-                else:
-                    print(f"✗ {ticker} のチャート生成に失敗")
-            except Exception as e:
-                print(f"✗ {ticker} のチャート生成でエラー: {str(e)}")
-        
+
+        # 各銘柄のチャートをプロセスプールで並列生成（全件）
+        breakout_chart_img_paths = generate_charts_parallel(breakout_tickers, company_names, consecutive_tickers)
+        print(f"✓ ブレイク銘柄チャート生成: {len(breakout_chart_img_paths)}/{len(breakout_tickers)} 件")
+
         # チャートを結合（10銘柄ずつに分割）
-        combined_breakout_chart_paths = combine_charts(breakout_chart_img_paths, charts_per_image=10)
+        combined_breakout_chart_images = combine_charts(breakout_chart_img_paths, charts_per_image=10)
         
-        if combined_breakout_chart_paths:
+        if combined_breakout_chart_images:
             breakout_charts_images_html = ""
-            for i, chart_path in enumerate(combined_breakout_chart_paths):
-                url = upload_image_to_wordpress(chart_path)
+            urls = upload_images_to_wordpress(combined_breakout_chart_images)
+            for i, url in enumerate(urls):
                 if url:
                     breakout_charts_images_html += f"<div style=\"margin: 20px 0; text-align: center;\"><img src=\"{url}\" alt=\"レンジブレイク銘柄チャート\" style=\"max-width: 100%; height: auto; border: 1px solid #ddd; border-radius: 5px;\"></div>"
                     print(f"✓ ブレイクチャート {i+1} を投稿内容に追加")
                 else:
-                    print(f"✗ ブレイクチャート {i+1} の画像アップロードに失敗: {chart_path}")
+                    print(f"✗ ブレイクチャート {i+1} の画像アップロードに失敗: {combined_breakout_chart_images[i][0]}")
             
             if breakout_charts_images_html:
-                breakout_charts_section = f"""
-                <h3>ブレイク銘柄チャート</h3>
-                <p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>
-                <p><!-- wp:st-blocks/st-slidebox --></p>
-                <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-                <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-                <div class="st-slidebox" data-st-slidebox-content="">
-                <div class="scroll-box">
-                {breakout_charts_images_html}
-                </div>
-                </div>
-                </div>
-                <p><!-- /wp:st-blocks/st-slidebox --></p>
-                """
+                # スライドボックスの骨組みは投稿本文と共通のテンプレートを使用
+                breakout_charts_section = (
+                    "<h3>ブレイク銘柄チャート</h3>\n"
+                    "<p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>"
+                    + _slidebox(breakout_charts_images_html)
+                )
                 print(f"✓ 全ブレイクチャートを投稿内容に追加")
                 return breakout_charts_section
         else:
@@ -579,46 +979,30 @@ def generate_all_above_charts(all_above_csv_file_path, company_names, consecutiv
         all_above_df = pd.read_csv(all_above_csv_file_path, encoding='utf-8-sig')
         all_above_tickers = all_above_df['Ticker'].tolist()
 
-        # 各銘柄のチャートを生成（全件）
-        for i, ticker in enumerate(all_above_tickers):
-            try:
-                chart_path = generate_chart(ticker, company_names, consecutive_tickers)
-                if chart_path:
-                    all_above_chart_img_paths.append(chart_path)
-                    print(f"✓ {ticker} のAllAboveチャートを生成")
-                else:
-                    print(f"✗ {ticker} のAllAboveチャート生成に失敗")
-            except Exception as e:
-                print(f"✗ {ticker} のAllAboveチャート生成でエラー: {str(e)}")
+        # 各銘柄のチャートをプロセスプールで並列生成（全件）
+        all_above_chart_img_paths = generate_charts_parallel(all_above_tickers, company_names, consecutive_tickers)
+        print(f"✓ AllAbove銘柄チャート生成: {len(all_above_chart_img_paths)}/{len(all_above_tickers)} 件")
 
         # チャートを結合（10銘柄ずつに分割）
-        combined_all_above_chart_paths = combine_charts(all_above_chart_img_paths, charts_per_image=10)
+        combined_all_above_chart_images = combine_charts(all_above_chart_img_paths, charts_per_image=10)
 
-        if combined_all_above_chart_paths:
+        if combined_all_above_chart_images:
             all_above_charts_images_html = ""
-            for i, chart_path in enumerate(combined_all_above_chart_paths):
-                url = upload_image_to_wordpress(chart_path)
+            urls = upload_images_to_wordpress(combined_all_above_chart_images)
+            for i, url in enumerate(urls):
                 if url:
                     all_above_charts_images_html += f"<div style=\"margin: 20px 0; text-align: center;\"><img src=\"{url}\" alt=\"AllAbove銘柄チャート\" style=\"max-width: 100%; height: auto; border: 1px solid #ddd; border-radius: 5px;\"></div>"
                     print(f"✓ AllAboveチャート {i+1} を投稿内容に追加")
                 else:
-                    print(f"✗ AllAboveチャート {i+1} の画像アップロードに失敗: {chart_path}")
+                    print(f"✗ AllAboveチャート {i+1} の画像アップロードに失敗: {combined_all_above_chart_images[i][0]}")
 
             if all_above_charts_images_html:
-                all_above_charts_section = f"""
-                <h3>AllAbove銘柄チャート</h3>
-                <p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>
-                <p><!-- wp:st-blocks/st-slidebox --></p>
-                <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-                <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-                <div class="st-slidebox" data-st-slidebox-content="">
-                <div class="scroll-box">
-                {all_above_charts_images_html}
-                </div>
-                </div>
-                </div>
-                <p><!-- /wp:st-blocks/st-slidebox --></p>
-                """
+                # スライドボックスの骨組みは投稿本文と共通のテンプレートを使用
+                all_above_charts_section = (
+                    "<h3>AllAbove銘柄チャート</h3>\n"
+                    "<p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>"
+                    + _slidebox(all_above_charts_images_html)
+                )
                 print(f"✓ 全AllAboveチャートを投稿内容に追加")
                 return all_above_charts_section
         else:
@@ -648,47 +1032,31 @@ def generate_push_mark_charts(push_mark_csv_file_path, company_names, consecutiv
     try:
         push_mark_df = pd.read_csv(push_mark_csv_file_path, encoding='utf-8-sig')
         push_mark_tickers = push_mark_df['Ticker'].tolist()
-        
-        # 各銘柄のチャートを生成（全件）
-        for i, ticker in enumerate(push_mark_tickers):
-            try:
-                chart_path = generate_chart(ticker, company_names, consecutive_tickers)
-                if chart_path:
-                    push_mark_chart_img_paths.append(chart_path)
-                    print(f"✓ {ticker} の押し目チャートを生成")
-                else:
-                    print(f"✗ {ticker} の押し目チャート生成に失敗")
-            except Exception as e:
-                print(f"✗ {ticker} の押し目チャート生成でエラー: {str(e)}")
-        
+
+        # 各銘柄のチャートをプロセスプールで並列生成（全件）
+        push_mark_chart_img_paths = generate_charts_parallel(push_mark_tickers, company_names, consecutive_tickers)
+        print(f"✓ 押し目銘柄チャート生成: {len(push_mark_chart_img_paths)}/{len(push_mark_tickers)} 件")
+
         # チャートを結合（10銘柄ずつに分割）
-        combined_push_mark_chart_paths = combine_charts(push_mark_chart_img_paths, charts_per_image=10)
+        combined_push_mark_chart_images = combine_charts(push_mark_chart_img_paths, charts_per_image=10)
         
-        if combined_push_mark_chart_paths:
+        if combined_push_mark_chart_images:
             push_mark_charts_images_html = ""
-            for i, chart_path in enumerate(combined_push_mark_chart_paths):
-                url = upload_image_to_wordpress(chart_path)
+            urls = upload_images_to_wordpress(combined_push_mark_chart_images)
+            for i, url in enumerate(urls):
                 if url:
                     push_mark_charts_images_html += f"<div style=\"margin: 20px 0; text-align: center;\"><img src=\"{url}\" alt=\"押し目銘柄チャート\" style=\"max-width: 100%; height: auto; border: 1px solid #ddd; border-radius: 5px;\"></div>"
                     print(f"✓ 押し目チャート {i+1} を投稿内容に追加")
                 else:
-                    print(f"✗ 押し目チャート {i+1} の画像アップロードに失敗: {chart_path}")
+                    print(f"✗ 押し目チャート {i+1} の画像アップロードに失敗: {combined_push_mark_chart_images[i][0]}")
             
             if push_mark_charts_images_html:
-                push_mark_charts_section = f"""
-                <h3>押し目銘柄チャート</h3>
-                <p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>
-                <p><!-- wp:st-blocks/st-slidebox --></p>
-                <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-                <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-                <div class="st-slidebox" data-st-slidebox-content="">
-                <div class="scroll-box">
-                {push_mark_charts_images_html}
-                </div>
-                </div>
-                </div>
-                <p><!-- /wp:st-blocks/st-slidebox --></p>
-                """
+                # スライドボックスの骨組みは投稿本文と共通のテンプレートを使用
+                push_mark_charts_section = (
+                    "<h3>押し目銘柄チャート</h3>\n"
+                    "<p>各銘柄の株価チャートです。過去6ヶ月間の価格推移と出来高を表示しています。</p>"
+                    + _slidebox(push_mark_charts_images_html)
+                )
                 print(f"✓ 全押し目チャートを投稿内容に追加")
                 return push_mark_charts_section
         else:
@@ -709,155 +1077,88 @@ def main():
     print("古いチャートファイルの削除が完了しました")
     
     # 読み込むCSVファイルのパス
-    # ここを変更：StockSignal → StockAnalysis_Technical
-    breakout_csv_file_path = "C:\\Users\\mount\\Git\\StockAnalysis_Technical\\StockSignal\\Result\\Breakout.csv" # ブレイク銘柄CSV
-    all_above_csv_file_path = "C:\\Users\\mount\\Git\\StockAnalysis_Technical\\StockSignal\\Result\\AllAbove.csv" # AllAbove銘柄CSV
-    push_mark_csv_file_path = "C:\\Users\\mount\\Git\\StockAnalysis_Technical\\StockSignal\\Result\\push_mark.csv" # 押し目狙い銘柄抽出
-
-    # 各CSVファイルを読み込んで、銘柄コード(Ticker)列で昇順ソートして再保存
-    # 表示時に銘柄コードでソートされた状態にするため
-    for file_path in [breakout_csv_file_path, all_above_csv_file_path, push_mark_csv_file_path]:
+    # （絶対パスを列挙せず、モジュール位置から解決したResultディレクトリ配下で統一）
+    breakout_csv_file_path = os.path.join(_RESULT_DIR, "Breakout.csv") # ブレイク銘柄CSV
+    all_above_csv_file_path = os.path.join(_RESULT_DIR, "AllAbove.csv") # AllAbove銘柄CSV
+    push_mark_csv_file_path = os.path.join(_RESULT_DIR, "push_mark.csv") # 押し目狙い銘柄抽出
+
+    # 各CSVファイルを読み込んで銘柄コード(Ticker)列で昇順ソートし、
+    # ソート済みのDataFrameをそのままHTML表に変換する
+    # （書き戻したCSVを再度読み直していた1ファイルあたり1回分のパースを省略。
+    #   ソート結果の上書き保存は後工程がCSVを参照するため維持）
+    def _sort_and_render(file_path):
         df = pd.read_csv(file_path, encoding='utf-8')    # CSVファイルを読み込み
-        df_sorted = df.sort_values(by='Ticker')          # Ticker列で昇順ソート
+        # Ticker列を数値化してからソート（object型のPythonレベル比較を回避）
+        # ※errors='ignore'はpandas 3.0で廃止されたため使わない。
+        #   "135A"のような英字入りコードが混在するファイルは数値化できない
+        #   ので、従来どおりobject型のままソートする
+        try:
+            df['Ticker'] = pd.to_numeric(df['Ticker'])
+        except (ValueError, TypeError):
+            pass
+        df_sorted = df.sort_values(by='Ticker', kind='stable')  # Ticker列で昇順ソート
         df_sorted.to_csv(file_path, index=False, encoding='utf-8')  # ソート結果を上書き保存
+        return df_to_html_table(df_sorted)
 
-    # CSVデータをHTML表に変換（各テーブルの銘柄数も取得）
-    html_table_breakout, breakout_count = read_csv_to_html_table(breakout_csv_file_path) # ブレイク銘柄テーブル
-    html_table_all_above, all_above_count = read_csv_to_html_table(all_above_csv_file_path) # AllAbove銘柄テーブル
-    html_table_push_mark, push_mark_count = read_csv_to_html_table(push_mark_csv_file_path) # 押し目狙い銘柄テーブル
-    
-    # 投稿のタイトルと内容を作成
-    post_title = "【日本株】銘柄抽出結果_{current_date} | 今日の押し目買い狙い&ブレイクアウト銘柄".format(current_date=current_date)  # 投稿タイトル
+    # ディスクI/Oが支配的な処理のため、スレッドプールで3ファイルを並行処理する
+    # （executor.mapは入力順に結果を返す）
+    file_paths = [breakout_csv_file_path, all_above_csv_file_path, push_mark_csv_file_path]
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(_sort_and_render, file_paths))
+
+    # HTML表と各テーブルの銘柄数
+    html_table_breakout, breakout_count = results[0] # ブレイク銘柄テーブル
+    html_table_all_above, all_above_count = results[1] # AllAbove銘柄テーブル
+    html_table_push_mark, push_mark_count = results[2] # 押し目狙い銘柄テーブル
     
     # 投稿本文のHTML構成
     # WordPressテーマ「AFFINGER」用のスライドボックスブロックを使用
     # 初期状態では折りたたまれており、クリックで展開される
-    
+    # 断片をリストに集めて最後に1回だけ結合する（+=連結による中間文字列の
+    # 再割り当てを避ける）
+
     # ブレイク銘柄のテーブルを追加
-    post_content = f"""
-        {intro_text}
-        <h2>ブレイク銘柄 ({breakout_count})</h2>
-        <p>過去3か月間の最高値を更新した銘柄です。</p>
-        <p>下記の条件で抽出しています。
-        </p>[st-mybox title="ブレイク銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
-        <ol>
-        <li>最新の終値が、直近3か月の高値を更新</li>
-        <li>出来高が10万以上</li>
-        <li>終値が高値と安値の中間より上</li>
-        <li>陽線で引けている</li>
-        </ol>
-        [/st-mybox]        
-        <p><a href="https://www.takstorage.site/%e3%83%96%e3%83%ac%e3%82%a4%e3%82%af%e3%82%a2%e3%82%a6%e3%83%88%e5%80%99%e8%a3%9c%e9%8a%98%e6%9f%84%e3%81%ae%e6%8a%bd%e5%87%ba%e6%9d%a1%e4%bb%b6%e3%81%a8%e3%81%af%ef%bc%9f%e3%82%a8%e3%83%b3%e3%83%88/" target="_blank" rel="noopener noreferrer"><strong>解説記事はコチラ</strong></a></p>
-        <p><!-- wp:st-blocks/st-slidebox --></p>
-        <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-        <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-        <div class="st-slidebox" data-st-slidebox-content="">
-        <div class="scroll-box">
-        ブレイク銘柄
-        {html_table_breakout}
-        </div>
-        </div>
-        </div>
-        <p><!-- /wp:st-blocks/st-slidebox --></p>
-        """
-    
+    parts = [
+        INTRO_HTML,
+        _BREAKOUT_HEADER_TMPL.format(count=breakout_count),
+        _slidebox(f"ブレイク銘柄\n        {html_table_breakout}"),
+    ]
+
     # 銘柄名辞書を読み込み
     company_names = load_company_names()
-    
+
     # 連続該当銘柄を特定（main.pyでバックアップ済み）
     consecutive_tickers = get_consecutive_tickers()
-    
+
     # ブレイク銘柄のチャートを生成して投稿内容に追加
-    breakout_charts_section = generate_breakout_charts(breakout_csv_file_path, company_names, consecutive_tickers)
-    post_content += breakout_charts_section
-    
+    parts.append(generate_breakout_charts(breakout_csv_file_path, company_names, consecutive_tickers))
+
     # 連続該当銘柄を装飾
-    decorated_company_names = {ticker: decorate_company_name(ticker, company_names[ticker], consecutive_tickers) for ticker in consecutive_tickers['breakout'] | consecutive_tickers['all_above'] | consecutive_tickers['push_mark']}
-    
+    consecutive_union = consecutive_tickers['breakout'] | consecutive_tickers['all_above'] | consecutive_tickers['push_mark']
+    decorated_company_names = {ticker: decorate_company_name(ticker, company_names[ticker], consecutive_tickers) for ticker in consecutive_union}
+
     # 連続該当銘柄を投稿内容に追加
-    post_content += f"""
-        <h3>連続ブレイクアウト該当銘柄</h3>
-        <p>前回の結果と今回の結果で連続している銘柄です。</p>
-        <p>この銘柄は、前回の抽出結果でも登場し、連日ブレイクしている銘柄です。</p>
-        <p><!-- wp:st-blocks/st-slidebox --></p>
-        <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-        <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-        <div class="st-slidebox" data-st-slidebox-content="">
-        <div class="scroll-box">
-        """
-    for ticker in consecutive_tickers['breakout'] | consecutive_tickers['all_above'] | consecutive_tickers['push_mark']:
-        post_content += f"<p>{decorated_company_names[ticker]}</p>"
-    post_content += """
-        </div>
-        </div>
-        </div>
-        <p><!-- /wp:st-blocks/st-slidebox --></p>
-        """
+    parts.append(_CONSECUTIVE_HEADER)
+    parts.append(_slidebox(''.join(f"<p>{decorated_company_names[ticker]}</p>" for ticker in consecutive_union)))
 
     # AllAbove銘柄のテーブルを追加
-    post_content += f"""
-        <h2>AllAbove銘柄 ({all_above_count})</h2>
-        <p>パーフェクトオーダーかつ短期移動平均の上で推移している銘柄です。</p>
-        <p>下記の条件で抽出しています。
-        </p>[st-mybox title="AllAbove銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
-        <ol>
-        <li>パーフェクトオーダー（短期(5日)移動平均線 &gt; 中期(20日)移動平均線 &gt; 長期(60日)移動平均線）</li>
-        <li>最新ローソク足の始値と終値の中間値が短期移動平均線以上</li>
-        <li>株価が500円以上</li>
-        <li>出来高が20万以上</li>
-        </ol>
-        [/st-mybox]
-        <p><!-- wp:st-blocks/st-slidebox --></p>
-        <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-        <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-        <div class="st-slidebox" data-st-slidebox-content="">
-        <div class="scroll-box">
-        AllAbove銘柄
-        {html_table_all_above}
-        </div>
-        </div>
-        </div>
-        <p><!-- /wp:st-blocks/st-slidebox --></p>
-        """
+    parts.append(_ALL_ABOVE_HEADER_TMPL.format(count=all_above_count))
+    parts.append(_slidebox(f"AllAbove銘柄\n        {html_table_all_above}"))
 
     # AllAbove銘柄のチャートを生成して投稿内容に追加
-    all_above_charts_section = generate_all_above_charts(all_above_csv_file_path, company_names, consecutive_tickers)
-    post_content += all_above_charts_section
+    parts.append(generate_all_above_charts(all_above_csv_file_path, company_names, consecutive_tickers))
+
+    # 押し目狙い銘柄のテーブルを追加
+    parts.append(_PUSH_MARK_HEADER_TMPL.format(count=push_mark_count))
+    parts.append(_slidebox(f"押し目狙い銘柄\n        {html_table_push_mark}"))
 
-    post_content += f"""
-        <h2>押し目狙い銘柄 ({push_mark_count})</h2>
-        <p>中期移動平均が上昇中で、終値が短期移動平均より上、直近で短期移動平均が下落した日があり、出来高も条件を満たす押し目狙いの銘柄です。</p>
-        <p>下記の条件で抽出しています。
-        </p>[st-mybox title="押し目狙い銘柄を抽出する条件" webicon="st-svg-check-circle" color="#03A9F4" bordercolor="#B3E5FC" bgcolor="#E1F5FE" borderwidth="2" borderradius="5" titleweight="bold"]
-        <ol>
-        <li>中期移動平均線が上昇中（前日より高い）</li>
-        <li>終値が短期移動平均線より上</li>
-        <li>直近3日以内に、短期移動平均線の変動率がマイナスの日が1日以上ある</li>
-        <li>中期移動線が長期移動平均線より上</li>
-        <li>出来高が10万以上</li>
-        <li>出来高が出来高移動平均線より多い</li>
-        </ol>
-        [/st-mybox]        
-        <p><a href="https://www.takstorage.site/%e6%8a%bc%e3%81%97%e7%9b%ae%e8%b2%b7%e3%81%84%e5%80%99%e8%a3%9c%e9%8a%98%e6%9f%84%e3%81%af%e3%81%a9%e3%81%86%e3%81%84%e3%81%86%e6%9d%a1%e4%bb%b6%e3%81%a7%e6%8a%bd%e5%87%ba%e3%81%97%e3%81%a6%e3%81%84/" target="_blank" rel="noopener noreferrer"><strong>解説記事はコチラ</strong></a></p>
-        <p><!-- wp:st-blocks/st-slidebox --></p>
-        <div class="wp-block-st-blocks-st-slidebox st-slidebox-c is-collapsed has-st-toggle-icon is-st-toggle-position-left is-st-toggle-icon-position-left" data-st-slidebox="">
-        <p class="st-btn-open" data-st-slidebox-toggle=""><i class="st-fa st-svg-plus-thin" data-st-slidebox-icon="" data-st-slidebox-icon-collapsed="st-svg-plus-thin" data-st-slidebox-icon-expanded="st-svg-minus-thin" aria-hidden=""></i><span class="st-slidebox-btn-text" data-st-slidebox-text="" data-st-slidebox-text-collapsed="クリックして展開" data-st-slidebox-text-expanded="閉じる">クリックして下さい</span></p>
-        <div class="st-slidebox" data-st-slidebox-content="">
-        <div class="scroll-box">
-        押し目狙い銘柄
-        {html_table_push_mark}
-        </div>
-        </div>
-        </div>
-        <p><!-- /wp:st-blocks/st-slidebox --></p>
-        """
-    
     # 押し目銘柄のチャートを生成して投稿内容に追加
-    push_mark_charts_section = generate_push_mark_charts(push_mark_csv_file_path, company_names, consecutive_tickers)
-    post_content += push_mark_charts_section
-    
+    parts.append(generate_push_mark_charts(push_mark_csv_file_path, company_names, consecutive_tickers))
+
+    post_content = ''.join(parts)
+
     # WordPressに投稿を送信
-    post_to_wordpress(post_title, post_content)
+    post_to_wordpress(POST_TITLE, post_content)
     # print(post_content)  # デバッグ用：投稿内容をコンソールに出力（必要に応じてコメント解除）
 
 
@@ -13,19 +13,24 @@
 - matplotlib: グラフ描画
 - japanize_matplotlib: 日本語表示対応
 """
+import json
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import os
 from datetime import datetime, timedelta
-import japanize_matplotlib
-import mplfinance as mpf
-from matplotlib.ticker import FuncFormatter
+from matplotlib.ticker import FixedFormatter, FixedLocator
 from matplotlib import font_manager as fm
-import yfinance as yf
 from typing import Optional
 import shutil
 
+# mplfinance / japanize_matplotlib / yfinance はインポートが重いため
+# モジュールトップでは読み込まず、実際に使う箇所で遅延インポートする
+# （ティッカー列挙だけの呼び出しやプロセスプールの子プロセス起動で
+#   フルスタックのインポートコストを払わない）
+
 # 結果バックアップ機能のインポート
 from result_backup import backup_previous_results, get_consecutive_tickers, decorate_company_name
 
@@ -36,13 +41,39 @@ possible_fonts = [
     r"C:\\Windows\\Fonts\\msgothic.ttc",
     r"C:\\Windows\\Fonts\\YuGothM.ttc"
 ]
-for fpath in possible_fonts:
-    if os.path.exists(fpath):
-        try:
-            fm.fontManager.addfont(fpath)
-        except Exception:
-            pass
-plt.rcParams['font.family'] = ['Meiryo', 'Yu Gothic', 'MS Gothic']
+
+# フォント登録済みフラグ（addfontはフォントメタデータを毎回再スキャン
+# するため、プロセス内で二重に実行しないようガードする）
+_FONTS_REGISTERED = False
+
+
+def _register_fonts():
+    """
+    日本語フォントをfontManagerへ登録します（プロセス内で1回だけ実行）
+
+    登録済みフォントファイルはaddfontを呼ばずにスキップします。
+    プロセスプールのワーカー初期化からも呼ばれます。
+    """
+    global _FONTS_REGISTERED
+    if _FONTS_REGISTERED:
+        return
+
+    registered_files = {f.fname for f in fm.fontManager.ttflist}
+    for fpath in possible_fonts:
+        if os.path.exists(fpath) and fpath not in registered_files:
+            try:
+                fm.fontManager.addfont(fpath)
+            except Exception:
+                pass
+    plt.rcParams['font.family'] = ['Meiryo', 'Yu Gothic', 'MS Gothic']
+    _FONTS_REGISTERED = True
+
+
+_register_fonts()
+
+# 銘柄名辞書のプロセス内キャッシュ
+# （同一プロセスでChartGeneratorを複数回生成してもCSVパースは1回で済む）
+_COMPANY_NAMES_CACHE = {}
 
 class ChartGenerator:
     """
@@ -70,9 +101,18 @@ class ChartGenerator:
         # 銘柄名辞書の読み込み
         self.company_names = self._load_company_names()
         
-        # チャートのスタイル設定
+        # チャートのスタイル設定（重いライブラリはここで遅延インポート）
+        import japanize_matplotlib
+        import mplfinance as mpf
+
         plt.style.use('default')
         japanize_matplotlib.japanize()
+
+        # mplfinanceのスタイルは銘柄によらず同一のため、1回だけ構築して
+        # 全チャートで使い回す（チャートごとのdict構築とGC負荷を削減）
+        self._mc = mpf.make_marketcolors(up='#d32f2f', down='#1e88e5', inherit=True)
+        self._style = mpf.make_mpf_style(base_mpf_style='yahoo', marketcolors=self._mc,
+                                         rc={'font.family': 'Meiryo'})
     
     def get_roe_for_ticker(self, ticker) -> Optional[float]:
         """
@@ -85,6 +125,8 @@ class ChartGenerator:
             ROE値（パーセンテージ）、取得できない場合はNone
         """
         try:
+            import yfinance as yf
+
             # tickerを文字列に変換
             ticker_str = str(ticker)
             
@@ -113,19 +155,100 @@ class ChartGenerator:
             print(f"{ticker_str}: ROE取得中にエラーが発生しました: {str(e)}")
             return None
     
+    def load_roe_batch(self, tickers):
+        """
+        複数銘柄のROE情報をyfinanceから一括取得します
+
+        銘柄ごとに yf.Ticker(...).info を呼ぶと1銘柄につき1回のHTTPS往復が
+        発生するため、yf.Tickers で接続を共有した一括問い合わせに置き換えます。
+        取得結果は日付付きのJSONファイルにキャッシュし、同日の再実行では
+        ネットワークアクセスをスキップします。
+
+        Args:
+            tickers (list): 銘柄コードのリスト
+
+        Returns:
+            dict: ティッカー（文字列）をキー、ROE値（パーセンテージ）を値とする辞書
+        """
+        cache_file = os.path.join(self.result_dir, f"roe_cache_{datetime.now().strftime('%Y%m%d')}.json")
+
+        # 同日のキャッシュがあればそれを使用（ネットワークアクセス不要）
+        if os.path.exists(cache_file):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except Exception as e:
+                print(f"ROEキャッシュの読み込みエラー: {e}")
+
+        roe_map = {}
+        try:
+            import yfinance as yf
+
+            # 日本株の場合は.Tを付けて一括問い合わせ
+            symbols = [t if t.endswith('.T') else f"{t}.T" for t in (str(t) for t in tickers)]
+            batch = yf.Tickers(" ".join(symbols))
+
+            for symbol, stock in batch.tickers.items():
+                ticker_str = symbol[:-2] if symbol.endswith('.T') else symbol
+                try:
+                    roe = stock.info.get('returnOnEquity')
+                    if roe is not None:
+                        # 小数形式をパーセンテージに変換
+                        roe_map[ticker_str] = round(roe * 100, 2)
+                except Exception as e:
+                    print(f"{ticker_str}: ROE取得中にエラーが発生しました: {str(e)}")
+        except Exception as e:
+            print(f"ROE一括取得中にエラーが発生しました: {str(e)}")
+
+        # 次回実行用にキャッシュを保存
+        try:
+            os.makedirs(self.result_dir, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(roe_map, f)
+        except Exception as e:
+            print(f"ROEキャッシュの保存エラー: {e}")
+
+        return roe_map
+
     def _load_company_names(self):
         """
         銘柄名辞書を読み込み
-        
+
         企業リストCSVファイルからティッカーと銘柄名のマッピングを作成します。
-        
+        初回読み込み時にfeatherキャッシュを作成し、2回目以降はCSVパースの
+        代わりにfeatherを読み込みます（企業リストは数千行あるためCSVパースが
+        インスタンス生成のたびに走るのを避ける）。結果の辞書はモジュール
+        レベルでもメモ化し、同一プロセス内の複数インスタンスで共有します。
+
         Returns:
             dict: ティッカーをキー、銘柄名を値とする辞書
         """
+        cached = _COMPANY_NAMES_CACHE.get(self.company_list_file)
+        if cached is not None:
+            return cached
+
         try:
-            df = pd.read_csv(self.company_list_file, encoding='utf-8')
+            feather_file = os.path.splitext(self.company_list_file)[0] + '.feather'
+
+            # featherキャッシュがCSVより新しければそちらを読む
+            if (os.path.exists(feather_file)
+                    and os.path.getmtime(feather_file) >= os.path.getmtime(self.company_list_file)):
+                df = pd.read_feather(feather_file)
+            else:
+                df = pd.read_csv(self.company_list_file, encoding='utf-8',
+                                 usecols=['Ticker', '銘柄名'], dtype={'Ticker': 'string'})
+                # 次回実行用にキャッシュを作成（失敗しても処理は続行）
+                try:
+                    df.to_feather(feather_file)
+                except Exception:
+                    pass
+
             # ティッカーを文字列に変換して辞書を作成
-            return dict(zip(df['Ticker'].astype(str), df['銘柄名']))
+            # （dict(zip(...))の要素ごとのボクシングを避け、pandasの
+            #   C実装の一括変換で辞書を構築する）
+            names = pd.Series(df['銘柄名'].to_numpy(), index=df['Ticker'].astype(str)).to_dict()
+            _COMPANY_NAMES_CACHE[self.company_list_file] = names
+            return names
         except Exception as e:
             print(f"銘柄名ファイルの読み込みエラー: {e}")
             return {}
@@ -141,7 +264,8 @@ class ChartGenerator:
             list: ブレイク銘柄のティッカーリスト
         """
         try:
-            df = pd.read_csv(self.breakout_file, encoding='utf-8-sig')
+            # 必要なのはTicker列だけなので他の列はパースしない
+            df = pd.read_csv(self.breakout_file, encoding='utf-8-sig', usecols=['Ticker'])
             return df['Ticker'].tolist()
         except Exception as e:
             print(f"Breakout.csvの読み込みエラー: {e}")
@@ -168,50 +292,93 @@ class ChartGenerator:
                 print(f"信号ファイルが見つかりません: {signal_file}")
                 return None
             
-            df = pd.read_csv(signal_file, encoding='utf-8')
-            
-            # 必要な列のみを選択
             required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-            if not all(col in df.columns for col in required_columns):
+
+            # テクニカル指標計算時に保存されたfeatherサイドカーがあれば優先
+            # （CSVパースを丸ごとスキップできる。CSVより古い場合は使わない）
+            feather_file = os.path.join(self.technical_signal_dir, f"{ticker_str}_signal.feather")
+            if (os.path.exists(feather_file)
+                    and os.path.getmtime(feather_file) >= os.path.getmtime(signal_file)):
+                try:
+                    df = pd.read_feather(feather_file, columns=required_columns)
+                    # シグナルファイルは日付昇順で書き出されるため、
+                    # 通常はソート済み＝O(N)の単調性チェックだけで済む
+                    if not df['Date'].is_monotonic_increasing:
+                        df.sort_values('Date', inplace=True)
+                    return df.iloc[-60:]
+                except Exception as e:
+                    print(f"featherサイドカーの読み込みに失敗しました ({ticker_str}): {e}")
+
+            # 必要な6列だけを型指定付きでパースする
+            # （全列トークナイズと読み込み後のto_datetime変換を省略）
+            try:
+                df = pd.read_csv(
+                    signal_file,
+                    encoding='utf-8',
+                    usecols=required_columns,
+                    dtype={'Open': 'float32', 'High': 'float32',
+                           'Low': 'float32', 'Close': 'float32',
+                           'Volume': 'int64'},
+                    parse_dates=['Date'],
+                )
+            except ValueError:
+                # usecols指定の列が存在しない場合
                 print(f"必要な列が見つかりません: {ticker_str}")
                 return None
-            
-            # 日付列をdatetime型に変換
-            df['Date'] = pd.to_datetime(df['Date'])
-            
+
             # 最新のデータから過去60日分を取得
-            df = df.sort_values('Date').tail(60)
-            
-            return df[required_columns]
-            
+            # （日付昇順で書き出されたファイルではソートは実質no-op）
+            if not df['Date'].is_monotonic_increasing:
+                df.sort_values('Date', inplace=True)
+
+            # 指標計算側でサイドカーが作られていなかった場合はここで補完し、
+            # 次回以降の読み込みをCSVパース不要にする（失敗しても続行）
+            try:
+                df.reset_index(drop=True).to_feather(feather_file)
+            except Exception:
+                pass
+
+            return df.iloc[-60:]
+
         except Exception as e:
             print(f"株価データの読み込みエラー ({ticker_str}): {e}")
             return None
     
-    def generate_chart(self, ticker, consecutive_tickers=None):
+    def generate_chart(self, ticker, consecutive_tickers=None, roe_map=None):
         """
         指定されたティッカーのチャートを生成
-        
+
         指定銘柄の株価データからローソク足チャートを生成し、
         移動平均線（5日・25日）と出来高を表示します。
         チャートには銘柄名とティッカーをタイトルとして表示します。
         連続該当銘柄の場合は銘柄名の先頭に「◎」を付与します。
-        
+
         Args:
             ticker (str): ティッカー
             consecutive_tickers (dict): 連続該当銘柄の辞書
-            
+            roe_map (dict): load_roe_batchで一括取得したROE辞書。
+                           指定がない場合は銘柄ごとに個別取得します。
+
         Returns:
             str: 生成されたチャートファイルのパス、失敗時はNone
         """
         try:
+            ticker_str = str(ticker)
+            signal_file = os.path.join(self.technical_signal_dir, f"{ticker_str}_signal.csv")
+            output_file = os.path.join(self.result_dir, f"{ticker_str}_chart.png")
+
+            # 入力のシグナルファイルより新しいPNGが既にあれば再生成しない
+            # （データ未更新の再実行ではI/Oも描画も丸ごとスキップできる）
+            if (os.path.exists(output_file) and os.path.exists(signal_file)
+                    and os.path.getmtime(output_file) > os.path.getmtime(signal_file)):
+                return output_file
+
+            import mplfinance as mpf
+
             # 株価データを読み込み
             df = self.load_stock_data(ticker)
             if df is None or df.empty:
                 return None
-            
-            # 銘柄名を取得（tickerを文字列に変換）
-            ticker_str = str(ticker)
             company_name = self.company_names.get(ticker_str, f"銘柄{ticker_str}")
             
             # 連続該当銘柄の場合、銘柄名の先頭に「◎」を付与
@@ -219,31 +386,35 @@ class ChartGenerator:
                 company_name = decorate_company_name(ticker, company_name, consecutive_tickers)
             
             # ROE情報を取得してROE値を追加
-            roe = self.get_roe_for_ticker(ticker)
+            # （一括取得済みの辞書があればHTTPアクセスなしで参照）
+            if roe_map is not None:
+                roe = roe_map.get(ticker_str)
+            else:
+                roe = self.get_roe_for_ticker(ticker)
             if roe is not None:
                 company_name += f' (ROE：{roe:.2f}%)'
             
             # mplfinance 用に整形
-            df_mpf = df.copy()
-            df_mpf = df_mpf.set_index('Date')
-            df_mpf = df_mpf[['Open', 'High', 'Low', 'Close', 'Volume']]
-
-            # 移動平均
-            mav = (5, 25)
-
-            # スタイル（フォント強制）
-            mc = mpf.make_marketcolors(up='#d32f2f', down='#1e88e5', inherit=True)
-            s = mpf.make_mpf_style(base_mpf_style='yahoo', marketcolors=mc, rc={'font.family': 'Meiryo'})
+            # load_stock_dataが返すのはDate+OHLCVの6列（列順も確定済み）なので、
+            # copyと列の再選択は不要。set_indexの戻り値だけで足りる
+            df_mpf = df.set_index('Date')
 
-            output_file = os.path.join(self.result_dir, f"{ticker_str}_chart.png")
+            # 移動平均線（5日・25日）はpandasのrolling（C実装）で事前計算し、
+            # addplotとして渡す（mplfinance内部での再計算をスキップ）
+            ma5 = df_mpf['Close'].rolling(5).mean()
+            ma25 = df_mpf['Close'].rolling(25).mean()
+            addplots = [
+                mpf.make_addplot(ma5, color='#f57c00', width=0.8),
+                mpf.make_addplot(ma25, color='#7b1fa2', width=0.8),
+            ]
 
             # プロット（出来高付き、ローソク足）し、軸を調整
             fig, axes = mpf.plot(
                 df_mpf,
                 type='candle',
-                mav=mav,
+                addplot=addplots,
                 volume=True,
-                style=s,
+                style=self._style,
                 figsize=(12, 8),
                 title=f"{ticker_str} - {company_name}",
                 tight_layout=True,
@@ -251,19 +422,116 @@ class ChartGenerator:
             )
 
             # 出来高軸の指数表記を無効化、桁区切り
+            # FuncFormatterだと描画パスのたびに目盛りごとのPythonコールバックが
+            # 走るため、ラベル文字列を1回だけ生成してFixedFormatterで固定する
             if isinstance(axes, dict) and 'volume' in axes:
-                axes['volume'].yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f"{int(x):,}" if x >= 1 else f"{x}"))
+                vol_ax = axes['volume']
             elif hasattr(axes, 'axes') and len(axes.axes) >= 2:
                 vol_ax = axes.axes[-1]
-                vol_ax.yaxis.set_major_formatter(FuncFormatter(lambda x, pos: f"{int(x):,}" if x >= 1 else f"{x}"))
+            else:
+                vol_ax = None
+            if vol_ax is not None:
+                ticks = vol_ax.get_yticks()
+                labels = [f"{int(t):,}" if t >= 1 else f"{t}" for t in ticks]
+                vol_ax.yaxis.set_major_locator(FixedLocator(ticks))
+                vol_ax.yaxis.set_major_formatter(FixedFormatter(labels))
 
-            fig.savefig(output_file, dpi=300, bbox_inches='tight')
+            # WordPress埋め込み用途にはdpi=150で十分（dpi=300比で
+            # ピクセル数・PNGエンコードコストとも約1/4になる）。
+            # bbox_inches='tight'は余白計測のための再レンダリングを伴うため
+            # 使わず、レイアウトはmpf.plotのtight_layoutに任せる。
+            # savefigのバックエンド間接参照（print_png層）は通さず、Aggの
+            # RGBAバッファを直接Pillowに渡してエンコードする。
+            # PNGのdeflate圧縮はレベル1（サイズはレベル6とほぼ同等のまま、
+            # エンコードが数倍速い）
+            from PIL import Image
+            fig.set_dpi(150)
+            fig.canvas.draw()
+            buf = np.asarray(fig.canvas.buffer_rgba())
+            Image.fromarray(buf).save(output_file, 'PNG', compress_level=1)
             plt.close(fig)
-            
+
             return output_file
-            
+
         except Exception as e:
             print(f"チャート生成エラー ({ticker}): {e}")
             return None
 
+    def generate_all(self, tickers, consecutive_tickers=None, roe_map=None):
+        """
+        複数銘柄のチャートをプロセスプールで並列生成します
+
+        チャート生成は銘柄ごとに完全に独立したCPUバウンド処理
+        （フォント描画・Aggラスタライズ・PNGエンコード）のため、
+        ProcessPoolExecutorでコア数ぶんの並列化を行います。
+        各ワーカーは初期化時にAggバックエンドを設定し、ChartGeneratorを
+        1回だけ生成して使い回します（銘柄名CSVの再パースを防ぐ）。
+
+        Args:
+            tickers (list): ティッカーのリスト
+            consecutive_tickers (dict): 連続該当銘柄の辞書
+            roe_map (dict): load_roe_batchで一括取得したROE辞書
+
+        Returns:
+            list: 生成されたチャートファイルのパスのリスト（失敗分は除く）
+        """
+        args = [(ticker, consecutive_tickers, roe_map) for ticker in tickers]
+        with ProcessPoolExecutor(
+            max_workers=os.cpu_count(),
+            initializer=_init_chart_worker,
+        ) as executor:
+            results = list(executor.map(_render_one, args))
+        return [path for path in results if path is not None]
+
+
+# =====================================================================
+# プロセスプール用ワーカー関数
+# （ProcessPoolExecutorに渡すためモジュールレベルに定義＝pickle可能）
+# =====================================================================
+
+# ワーカープロセスごとに1つだけ生成するChartGeneratorインスタンス
+_WORKER_GENERATOR = None
+
+
+def _init_chart_worker():
+    """
+    ワーカープロセスの初期化処理
+
+    GUIバックエンドを避けるためAggを設定し、ChartGeneratorを
+    プロセスにつき1回だけ生成します（インスタンスのpickle転送を回避）。
+    """
+    global _WORKER_GENERATOR
+    import matplotlib
+    matplotlib.use('Agg')
+    _register_fonts()
+
+    # フォントキャッシュのプリウォーム
+    # プロセス内で最初のテキスト描画はフォント解決とグリフキャッシュ構築を
+    # 伴い、Windowsでは数百msかかることがある。1銘柄目のチャートで払う
+    # 代わりにワーカー起動時に極小フィギュアを1回描画して済ませておく
+    try:
+        fm.findfont('Meiryo')
+        fig = plt.figure(figsize=(1, 1))
+        fig.text(0.5, 0.5, '0')
+        fig.canvas.draw()
+        plt.close(fig)
+    except Exception:
+        pass
+
+    _WORKER_GENERATOR = ChartGenerator()
+
+
+def _render_one(args):
+    """
+    1銘柄分のチャートを生成するワーカー関数
+
+    Args:
+        args (tuple): (ticker, consecutive_tickers, roe_map)
+
+    Returns:
+        str: 生成されたチャートファイルのパス、失敗時はNone
+    """
+    ticker, consecutive_tickers, roe_map = args
+    return _WORKER_GENERATOR.generate_chart(ticker, consecutive_tickers, roe_map)
+
 
@@ -140,6 +140,14 @@ MIN_VOLUME_THRESHOLD = 100000  # 10万株
 # 最新シグナルファイル名 - 最新の分析結果を保存するファイル名
 LATEST_SIGNAL_FILE = "latest_signal.csv"
 
+# =====================================================================
+# ROEキャッシュ設定
+# =====================================================================
+
+# ROEキャッシュ有効期間 - ROEは四半期単位でしか変わらないため、
+# この日数以内に取得済みの銘柄は再取得せずキャッシュ値を使用します
+ROE_TTL_DAYS = 7
+
 # =====================================================================
 # ボリンジャーバンド設定
 # =====================================================================
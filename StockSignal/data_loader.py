@@ -147,11 +147,12 @@ def load_company_info_map(is_test_mode: bool = False) -> Dict[str, Dict[str, str
         logger.error(f"企業リストに必要なカラムがありません: {missing_columns}")
         return company_info_map
 
-    for _, row in df.iterrows():
-        ticker_str = str(row['Ticker'])
-        company_info_map[ticker_str] = {
-            'company': row['銘柄名'],
-            'theme': row['テーマ']
+    # iterrowsは1行ごとにSeriesを生成するため数千行の企業リストでは遅い。
+    # itertuples（C実装のタプル走査）で必要な3列だけを読み出す
+    for ticker, company, theme in df[['Ticker', '銘柄名', 'テーマ']].itertuples(index=False, name=None):
+        company_info_map[str(ticker)] = {
+            'company': company,
+            'theme': theme
         }
 
     logger.info(f"{len(company_info_map)}社の会社情報マッピング（会社名・テーマ）を読み込みました")
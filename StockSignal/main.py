@@ -11,6 +11,7 @@ import sys
 import argparse
 import logging
 import importlib
+from concurrent.futures import ThreadPoolExecutor
 from typing import List
 from datetime import datetime
 
@@ -84,30 +85,32 @@ def main():
             signal_results = calculate_signals(tickers, is_test_mode)
             logger.info("テクニカル指標の計算が完了しました。")
             
-            # シグナル抽出後にブレイク銘柄の抽出処理を実行
-            logger.info("ブレイク銘柄の抽出を開始します...")
-            breakout_success = identify_breakouts(is_test_mode)
+            # シグナル抽出後に3種類の銘柄抽出処理を並行実行する
+            # それぞれ出力ファイルが異なる独立した処理で、CSVパースや
+            # ROE取得（ネットワークI/O）の待ち時間を互いに重ねられるため、
+            # 直列実行（所要時間の合計）ではなくスレッドプールで同時に走らせる
+            # （所要時間は最も遅い1本分に近づく）
+            logger.info("ブレイク・AllAbove・押し目銘柄の抽出を開始します...")
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                breakout_future = executor.submit(identify_breakouts, is_test_mode)
+                all_above_future = executor.submit(extract_all_above_signals, is_test_mode)
+                push_mark_future = executor.submit(extract_push_mark_signals, is_test_mode)
 
-            # ブレイク抽出の結果をログに記録
+                breakout_success = breakout_future.result()
+                all_above_success = all_above_future.result()
+                push_mark_success = push_mark_future.result()
+
+            # 各抽出処理の結果をログに記録
             if breakout_success:
                 logger.info("ブレイク銘柄の抽出が完了しました。")
             else:
                 logger.error("ブレイク銘柄の抽出中にエラーが発生しました。")
 
-            # AllAbove銘柄の抽出処理を実行
-            logger.info("AllAbove銘柄の抽出を開始します...")
-            all_above_success = extract_all_above_signals(is_test_mode)
-
             if all_above_success:
                 logger.info("AllAbove銘柄の抽出が完了しました。")
             else:
                 logger.error("AllAbove銘柄の抽出中にエラーが発生しました。")
 
-            # 押し目銘柄の抽出処理を実行
-            logger.info("押し目銘柄の抽出を開始します...")
-            push_mark_success = extract_push_mark_signals(is_test_mode)
-                                
-            # 押し目銘柄抽出の結果をログに記録
             if push_mark_success:
                 logger.info("押し目銘柄の抽出が完了しました。")
             else:
@@ -26,12 +26,17 @@
 
 抽出結果は Result/Breakout.csv / Result/AllAbove.csv / Result/push_mark.csv に出力されます。
 """
+import functools
 import os
-import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional
 
+import numpy as np
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 import config
 from data_loader import load_company_info_map
@@ -43,6 +48,15 @@ try:
 except ImportError:
     YFINANCE_AVAILABLE = False
 
+# yfinanceへの全リクエストで接続を使い回すセッション
+# （呼び出しごとのTCP+TLSハンドシェイクを省略し、一時的なエラーは自動リトライ）
+_YF_SESSION = requests.Session()
+_YF_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    max_retries=Retry(total=3, backoff_factor=0.3),
+))
+
 
 # =====================================================================
 # ROE情報取得ヘルパー
@@ -65,7 +79,7 @@ def get_roe_for_ticker(ticker: str, logger: logging.Logger) -> Optional[float]:
 
     try:
         ticker_with_suffix = ticker if ticker.endswith('.T') else f"{ticker}.T"
-        stock = yf.Ticker(ticker_with_suffix)
+        stock = yf.Ticker(ticker_with_suffix, session=_YF_SESSION)
         roe = stock.info.get('returnOnEquity')
 
         if roe is None:
@@ -79,6 +93,280 @@ def get_roe_for_ticker(ticker: str, logger: logging.Logger) -> Optional[float]:
         return None
 
 
+def _fetch_roe_with_retry(ticker: str, logger: logging.Logger, retries: int = 2) -> Optional[float]:
+    """
+    ROE取得をリトライ付きで実行するワーカー関数
+
+    スレッドプールから呼び出される前提のため、例外は内部で処理して
+    Noneを返します（1銘柄の失敗で全体を止めない）。
+
+    Args:
+        ticker: 銘柄コード
+        logger: ロガーオブジェクト
+        retries: 失敗時の再試行回数
+
+    Returns:
+        ROE値（パーセンテージ）。取得できない場合は None
+    """
+    for attempt in range(retries + 1):
+        roe = get_roe_for_ticker(ticker, logger)
+        if roe is not None:
+            return roe
+        if attempt < retries:
+            logger.debug(f"{ticker}: ROE取得をリトライします ({attempt + 1}/{retries})")
+    return None
+
+
+def get_roe_batch(tickers, logger: logging.Logger) -> Dict[str, Optional[float]]:
+    """
+    複数銘柄のROE情報をyf.Tickersで一括取得します
+
+    銘柄ごとに yf.Ticker(...) を生成すると1銘柄ずつTLSハンドシェイクと
+    セッション構築を繰り返すことになるため、yf.Tickers で全銘柄を
+    まとめて問い合わせ、内部の共有セッションで接続を使い回します。
+    個々の .info 読み出しはスレッドプールで並列化し、一括問い合わせで
+    取得できなかった銘柄は個別取得（_fetch_roe_with_retry）で補います。
+
+    Args:
+        tickers: 銘柄コードのリスト（".T"サフィックスなしでも可）
+        logger: ロガーオブジェクト
+
+    Returns:
+        dict: 銘柄コード（サフィックスなしの文字列）をキー、
+              ROE値（パーセンテージ、取得失敗時はNone）を値とする辞書
+    """
+    if not YFINANCE_AVAILABLE:
+        logger.warning("yfinanceライブラリが利用できません。ROE情報は取得されません。")
+        return {str(t): None for t in tickers}
+
+    ticker_strs = [str(t) for t in tickers]
+    symbols = [t if t.endswith('.T') else f"{t}.T" for t in ticker_strs]
+
+    try:
+        batch = yf.Tickers(" ".join(symbols), session=_YF_SESSION)
+    except Exception as e:
+        logger.error(f"ROE一括取得の初期化中にエラーが発生しました: {str(e)}")
+        return {t: None for t in ticker_strs}
+
+    def _read_roe(symbol: str) -> Optional[float]:
+        """共有セッション上で1銘柄分の.infoを読み出す"""
+        try:
+            roe = batch.tickers[symbol].info.get('returnOnEquity')
+            if roe is None:
+                return None
+            return round(roe * 100, 2)
+        except Exception as e:
+            logger.error(f"{symbol}: ROE取得中にエラーが発生しました: {str(e)}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        roes = list(executor.map(_read_roe, symbols))
+
+    roe_map = dict(zip(ticker_strs, roes))
+
+    # 一括問い合わせで取得できなかった銘柄は、個別のyf.Tickerで
+    # リトライ付きのフォールバック取得を試みる
+    # （一時的な応答不良でROE欄が欠けたまま次回TTLまで放置されるのを防ぐ。
+    #   ROE自体が存在しない銘柄もいるためリトライは1回に抑える）
+    failed_tickers = [t for t, r in roe_map.items() if r is None]
+    if failed_tickers:
+        with ThreadPoolExecutor(max_workers=12) as executor:
+            retried = list(executor.map(
+                lambda t: _fetch_roe_with_retry(t, logger, retries=1),
+                failed_tickers))
+        roe_map.update(dict(zip(failed_tickers, retried)))
+
+    return roe_map
+
+
+def _load_roe_cache(cache_file: str, logger: logging.Logger) -> Dict[str, float]:
+    """
+    ROEキャッシュファイルから有効期間内の値を読み込みます
+
+    ROEは四半期単位でしか変わらないため、config.ROE_TTL_DAYS 以内に
+    取得済みの銘柄は再問い合わせせずキャッシュ値を使用します。
+
+    Args:
+        cache_file: キャッシュCSVファイルのパス
+        logger: ロガーオブジェクト
+
+    Returns:
+        dict: 銘柄コードをキー、ROE値を値とする辞書（期限切れ行は含まない）
+    """
+    if not os.path.exists(cache_file):
+        return {}
+
+    try:
+        cache_df = pd.read_csv(cache_file, dtype={'ticker': str}, parse_dates=['fetched_at'])
+        cutoff = pd.Timestamp.now() - pd.Timedelta(days=config.ROE_TTL_DAYS)
+        valid = cache_df[cache_df['fetched_at'] >= cutoff]
+        return dict(zip(valid['ticker'], valid['roe']))
+    except Exception as e:
+        logger.warning(f"ROEキャッシュの読み込みに失敗しました: {str(e)}")
+        return {}
+
+
+def _update_roe_cache(cache_file: str, roe_map: Dict[str, Optional[float]],
+                      logger: logging.Logger) -> None:
+    """
+    新規取得したROE値をキャッシュファイルへ反映（upsert）します
+
+    取得に失敗した銘柄（None）は保存せず、次回実行時に再取得させます。
+    キャッシュの更新失敗は処理全体を止めるほどのことではないため、
+    警告ログを出して続行します。
+
+    Args:
+        cache_file: キャッシュCSVファイルのパス
+        roe_map: 銘柄コードをキー、取得したROE値を値とする辞書
+        logger: ロガーオブジェクト
+    """
+    fetched = {t: r for t, r in roe_map.items() if r is not None}
+    if not fetched:
+        return
+
+    try:
+        new_df = pd.DataFrame({
+            'ticker': list(fetched.keys()),
+            'roe': list(fetched.values()),
+            'fetched_at': pd.Timestamp.now(),
+        })
+        if os.path.exists(cache_file):
+            old_df = pd.read_csv(cache_file, dtype={'ticker': str}, parse_dates=['fetched_at'])
+            # 再取得した銘柄は新しい値で置き換える
+            old_df = old_df[~old_df['ticker'].isin(fetched)]
+            new_df = pd.concat([old_df, new_df], ignore_index=True)
+        new_df.to_csv(cache_file, index=False, encoding='utf-8')
+    except Exception as e:
+        logger.warning(f"ROEキャッシュの保存に失敗しました: {str(e)}")
+
+
+# =====================================================================
+# 表示フォーマット用ヘルパー
+# =====================================================================
+
+def _format_close(series: pd.Series) -> pd.Series:
+    """
+    終値の表示形式を整えます（整数値は整数、小数値は小数点以下1桁）
+
+    .applyによる1行ごとのPython関数呼び出しを避け、整数判定と丸めを
+    ndarrayへの一括演算で行います。出力は従来のlambdaと同じく
+    int/floatが混在し得るためobject型のSeriesで返します。
+
+    Args:
+        series: 終値のSeries
+
+    Returns:
+        pandas.Series: 表示用にフォーマットされたSeries
+    """
+    values = series.to_numpy(dtype='float64')
+    int_mask = values == np.floor(values)
+    out = np.round(values, 1).astype(object)
+    out[int_mask] = values[int_mask].astype('int64')
+    return pd.Series(out, index=series.index)
+
+
+# =====================================================================
+# 入出力ディレクトリの解決
+# =====================================================================
+
+def _resolve_io_dirs(is_test_mode: bool):
+    """
+    抽出処理の入出力ディレクトリを解決します
+
+    3つの抽出関数で同じ分岐が重複していたため共通化したもの。
+    出力ディレクトリはここで作成まで済ませます。
+
+    Args:
+        is_test_mode: テストモード時は別ディレクトリのデータを使用
+
+    Returns:
+        tuple: (シグナルCSVの入力ディレクトリ, 結果CSVの出力ディレクトリ)
+    """
+    if is_test_mode:
+        input_dir = os.path.join(config.TEST_DIR, "StockSignal", "TechnicalSignal")
+        output_dir = os.path.join(config.TEST_DIR, "Result")
+    else:
+        input_dir = config.TECHNICAL_DIR
+        output_dir = os.path.join(config.BASE_DIR, "StockSignal", "Result")
+
+    os.makedirs(output_dir, exist_ok=True)
+    return input_dir, output_dir
+
+
+# =====================================================================
+# 銘柄別シグナルファイルの共有ローダー
+# =====================================================================
+
+# 銘柄別シグナルファイルの末尾行キャッシュ
+# AllAbove抽出と押し目抽出は同じ{ticker}_signal.csv群の最新数行しか
+# 使わないため、1回の実行内で同じファイルを二度パースしないようにする
+_TICKER_TAIL_CACHE: Dict[str, Optional[pd.DataFrame]] = {}
+
+# 末尾行ローダーが読み込むカラム（AllAbove抽出と押し目抽出で使う列の和集合）
+# シグナルファイルは30列近くあるが、判定に使うのはこの数列だけなので
+# usecolsでパース量を絞る。日付インデックスは判定に使わないため読まない
+_TICKER_TAIL_COLUMNS = frozenset(
+    ['Open', 'Close', 'Volume']
+    + [f'MA{period}' for period in config.MA_PERIODS]
+    + [f'Volume_MA{config.MA_PERIODS[1]}']
+)
+
+
+@functools.lru_cache(maxsize=2)
+def _load_latest_signal(input_file: str) -> pd.DataFrame:
+    """
+    latest_signal.csv を読み込みます（実行内キャッシュ付き）
+
+    AllAbove抽出と押し目抽出が同じファイルをそれぞれパースし直すのを
+    防ぎます。maxsize=2は通常モードとテストモードのパスを想定。
+    戻り値のDataFrameは共有されるため、呼び出し側で変更しないこと。
+
+    Args:
+        input_file: latest_signal.csvのパス
+
+    Returns:
+        pandas.DataFrame: パース済みの最新シグナルデータ
+    """
+    return pd.read_csv(input_file, index_col=0, parse_dates=True)
+
+
+def _load_ticker_tail(input_dir: str, ticker, rows: int = 3) -> Optional[pd.DataFrame]:
+    """
+    指定銘柄のシグナルファイルの末尾数行を読み込みます（実行内キャッシュ付き）
+
+    Args:
+        input_dir: シグナルファイルのディレクトリ
+        ticker: 銘柄コード
+        rows: 保持する末尾行数（押し目抽出の3日チェックに合わせてデフォルト3行）
+
+    Returns:
+        pandas.DataFrame: 末尾rows行のデータ。ファイルがない/読めない場合は None
+    """
+    cache_key = os.path.join(input_dir, str(ticker))
+    if cache_key in _TICKER_TAIL_CACHE:
+        return _TICKER_TAIL_CACHE[cache_key]
+
+    ticker_signal_file = os.path.join(input_dir, f"{ticker}_signal.csv")
+    if not os.path.exists(ticker_signal_file):
+        _TICKER_TAIL_CACHE[cache_key] = None
+        return None
+
+    try:
+        # 日付のパース（strptime）はファイルごとの行数分のコストがかかる
+        # 一方、抽出側は日付を一切参照しないため、判定に使う列だけを
+        # 文字列のまま読み込む（存在しない列はusecolsの判定関数で除外され、
+        # 呼び出し側の必須カラムチェックでスキップされる）
+        df = pd.read_csv(ticker_signal_file,
+                         usecols=lambda col: col in _TICKER_TAIL_COLUMNS,
+                         parse_dates=False)
+        tail = df.tail(rows)
+    except Exception:
+        tail = None
+
+    _TICKER_TAIL_CACHE[cache_key] = tail
+    return tail
+
+
 # =====================================================================
 # ブレイクアウト銘柄抽出
 # =====================================================================
@@ -106,14 +394,7 @@ def identify_breakouts(is_test_mode: bool = False) -> bool:
 
     try:
         # 入出力ディレクトリの設定
-        if is_test_mode:
-            technical_dir = os.path.join(config.TEST_TECHNICAL_DIR, "StockSignal", "TechnicalSignal")
-            result_dir = os.path.join(config.TEST_DIR, "Result")
-        else:
-            technical_dir = config.TECHNICAL_DIR
-            result_dir = os.path.join(config.BASE_DIR, "StockSignal", "Result")
-
-        os.makedirs(result_dir, exist_ok=True)
+        technical_dir, result_dir = _resolve_io_dirs(is_test_mode)
 
         # 企業情報マッピング
         company_info_map = load_company_info_map(is_test_mode)
@@ -168,7 +449,10 @@ def identify_breakouts(is_test_mode: bool = False) -> bool:
                 high_diff_percent = (latest_data['High'] - latest_data['Close']) / latest_data['Open'] * 100
 
                 ticker = csv_file.split('_')[0]
-                logger.debug(f"銘柄: {ticker} / C1:{condition1} C2:{condition2} C3:{condition3} C4:{condition4}")
+                # f-stringはハンドラが捨てる場合でも整形コストがかかるため、
+                # DEBUGが有効なときだけ組み立てる
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"銘柄: {ticker} / C1:{condition1} C2:{condition2} C3:{condition3} C4:{condition4}")
 
                 if not (condition1 and condition2 and condition3 and condition4):
                     continue
@@ -187,7 +471,9 @@ def identify_breakouts(is_test_mode: bool = False) -> bool:
                     breakout_result['BB_Upper'] = latest_data['BB_Upper']
 
                 breakout_stocks.append(breakout_result)
-                logger.info(f"ブレイク銘柄を検出: {ticker} - {company_info.get('company', '')} ({company_info.get('theme', '')})")
+                # 銘柄ごとの検出ログはDEBUGに落とし、件数はループ後の
+                # サマリーログ（検出数）で報告する
+                logger.debug(f"ブレイク銘柄を検出: {ticker} - {company_info.get('company', '')} ({company_info.get('theme', '')})")
 
             except Exception as e:
                 logger.error(f"{csv_file}の処理中にエラーが発生しました: {str(e)}")
@@ -214,9 +500,7 @@ def identify_breakouts(is_test_mode: bool = False) -> bool:
             result_df = result_df.rename(columns=column_rename)
 
             # 終値の表示形式（整数 or 小数点1桁）
-            result_df['終値'] = result_df['終値'].apply(
-                lambda x: int(x) if x == int(x) else round(x, 1)
-            )
+            result_df['終値'] = _format_close(result_df['終値'])
             result_df['前日までの最高値'] = result_df['前日までの最高値'].round(2)
             result_df['上髭の長さ(%)'] = result_df['上髭の長さ(%)'].round(2)
 
@@ -225,19 +509,34 @@ def identify_breakouts(is_test_mode: bool = False) -> bool:
 
             # ROE情報の付加
             if YFINANCE_AVAILABLE:
-                logger.info("ROE情報の取得を開始します...")
-                result_df['ROE(%)'] = None
-
-                for index, row in result_df.iterrows():
-                    ticker = str(row['Ticker'])
-                    logger.info(f"ROE取得中 ({index + 1}/{len(result_df)}): {ticker} - {row['Company']}")
-                    roe = get_roe_for_ticker(ticker, logger)
-                    if roe is not None:
-                        result_df.at[index, 'ROE(%)'] = roe
-                        logger.info(f"  ROE: {roe}%")
-                    else:
-                        logger.warning(f"  ROE取得失敗")
-                    time.sleep(0.5)  # API制限回避
+                logger.info(f"ROE情報の取得を開始します... (対象: {len(result_df)} 銘柄)")
+
+                # 有効期間内のキャッシュ値がある銘柄はネットワークアクセスを省略
+                tickers = result_df['Ticker'].astype(str).tolist()
+                cache_file = os.path.join(result_dir, "roe_cache.csv")
+                cached_roes = _load_roe_cache(cache_file, logger)
+                fresh_tickers = [t for t in tickers if t not in cached_roes]
+                logger.info(
+                    f"キャッシュ利用: {len(tickers) - len(fresh_tickers)} 銘柄 / "
+                    f"新規取得: {len(fresh_tickers)} 銘柄"
+                )
+
+                # yf.Tickersで未キャッシュ銘柄を一括問い合わせし、共有セッションで
+                # 接続を使い回す（銘柄ごとのyf.Ticker生成 + TLSハンドシェイクを排除）。
+                # 個々の.info読み出しはget_roe_batch内のスレッドプールで並列化される。
+                # 取得結果はチャンク単位でキャッシュへ反映する＝チェックポイント。
+                # 途中で強制終了しても取得済み分は失われず、再実行時は
+                # キャッシュ済み銘柄がスキップされてそこから再開できる
+                roe_map = {}
+                checkpoint_size = 50
+                for start in range(0, len(fresh_tickers), checkpoint_size):
+                    chunk = fresh_tickers[start:start + checkpoint_size]
+                    chunk_map = get_roe_batch(chunk, logger)
+                    _update_roe_cache(cache_file, chunk_map, logger)
+                    roe_map.update(chunk_map)
+
+                roe_map.update(cached_roes)
+                result_df['ROE(%)'] = [roe_map.get(t) for t in tickers]
 
                 roe_success_count = result_df['ROE(%)'].notna().sum()
                 logger.info(f"ROE情報の取得が完了しました。成功: {roe_success_count}/{len(result_df)} 銘柄")
@@ -290,14 +589,7 @@ def extract_all_above_signals(is_test_mode: bool = False) -> bool:
 
     try:
         # 入出力ディレクトリの設定
-        if is_test_mode:
-            input_dir = os.path.join(config.TEST_DIR, "StockSignal", "TechnicalSignal")
-            output_dir = os.path.join(config.TEST_DIR, "Result")
-        else:
-            input_dir = os.path.join(config.BASE_DIR, "StockSignal", "TechnicalSignal")
-            output_dir = os.path.join(config.BASE_DIR, "StockSignal", "Result")
-
-        os.makedirs(output_dir, exist_ok=True)
+        input_dir, output_dir = _resolve_io_dirs(is_test_mode)
 
         input_file = os.path.join(input_dir, config.LATEST_SIGNAL_FILE)
         if not os.path.exists(input_file):
@@ -305,7 +597,7 @@ def extract_all_above_signals(is_test_mode: bool = False) -> bool:
             return False
 
         logger.info(f"{input_file} を読み込みます")
-        latest_df = pd.read_csv(input_file, index_col=0, parse_dates=True)
+        latest_df = _load_latest_signal(input_file)
 
         # 移動平均線のカラム名 (MA_PERIODS = [5, 20, 60])
         short_ma = f'MA{config.MA_PERIODS[0]}'
@@ -321,59 +613,79 @@ def extract_all_above_signals(is_test_mode: bool = False) -> bool:
         all_tickers = latest_df['Ticker'].unique()
         logger.info(f"処理対象の全銘柄数: {len(all_tickers)}")
 
-        all_above_tickers = []
+        # Tickerをインデックスにした参照用フレームを1回だけ作る
+        # （銘柄ごとのブールフィルタ＝全行スキャンをハッシュ参照に置き換える。
+        #   drop_duplicatesで従来のiloc[0]＝先頭一致の動作を維持する）
+        latest_by_ticker = latest_df.drop_duplicates('Ticker').set_index('Ticker', drop=False)
+
+        # 各銘柄の最新行を1枚のフレームに積み上げる
+        # （条件判定は銘柄ごとのスカラー比較ではなく、積み上げたndarrayへの
+        #   ベクトル演算で一括評価する）
+        required_cols = ['Open', 'Close', 'Volume', short_ma, mid_ma, long_ma]
+        latest_rows = []
 
         for ticker in all_tickers:
             try:
-                ticker_signal_file = os.path.join(input_dir, f"{ticker}_signal.csv")
-                if not os.path.exists(ticker_signal_file):
+                # 共有ローダー経由で末尾行を取得
+                # （押し目抽出と同一実行内ならパース済みキャッシュが使われる）
+                ticker_df = _load_ticker_tail(input_dir, ticker)
+                if ticker_df is None or ticker_df.empty:
                     continue
 
-                ticker_df = pd.read_csv(ticker_signal_file, index_col=0, parse_dates=True)
-                if ticker_df.empty:
-                    continue
-
-                required_cols = ['Open', 'Close', 'Volume', short_ma, mid_ma, long_ma]
                 if not all(col in ticker_df.columns for col in required_cols):
                     continue
 
                 latest_row = ticker_df.iloc[-1]
+                latest_rows.append((ticker,) + tuple(latest_row[col] for col in required_cols))
 
-                if pd.isna(latest_row[short_ma]) or pd.isna(latest_row[mid_ma]) or pd.isna(latest_row[long_ma]):
-                    continue
-
-                # 条件1: パーフェクトオーダー（短期MA > 中期MA > 長期MA）
-                condition1 = (latest_row[short_ma] > latest_row[mid_ma]) and (latest_row[mid_ma] > latest_row[long_ma])
-
-                # 条件2: 最新ローソク足の始値と終値の中間値が短期MA以上
-                mid_price = (latest_row['Open'] + latest_row['Close']) / 2
-                condition2 = mid_price >= latest_row[short_ma]
-
-                # 条件3: 終値が500円以上
-                condition3 = latest_row['Close'] >= 500
+            except Exception as e:
+                logger.warning(f"銘柄 {ticker} の処理中にエラーが発生しました: {str(e)}")
+                continue
 
-                # 条件4: 出来高が20万以上
-                condition4 = latest_row['Volume'] >= 200000
+        all_above_tickers = []
 
-                if not (condition1 and condition2 and condition3 and condition4):
-                    continue
+        if latest_rows:
+            latest = pd.DataFrame(latest_rows, columns=['Ticker'] + required_cols)
+
+            opens = latest['Open'].to_numpy(dtype='float64')
+            closes = latest['Close'].to_numpy(dtype='float64')
+            volumes = latest['Volume'].to_numpy(dtype='float64')
+            short_vals = latest[short_ma].to_numpy(dtype='float64')
+            mid_vals = latest[mid_ma].to_numpy(dtype='float64')
+            long_vals = latest[long_ma].to_numpy(dtype='float64')
+
+            # 移動平均が計算できていない銘柄（NaN）は除外
+            valid = ~(np.isnan(short_vals) | np.isnan(mid_vals) | np.isnan(long_vals))
+
+            # 最新ローソク足の始値と終値の中間値
+            mid_prices = (opens + closes) / 2
+
+            # 条件1: パーフェクトオーダー（短期MA > 中期MA > 長期MA）
+            # 条件2: 中間値が短期MA以上
+            # 条件3: 終値が500円以上
+            # 条件4: 出来高が20万以上
+            mask = (
+                valid
+                & (short_vals > mid_vals) & (mid_vals > long_vals)
+                & (mid_prices >= short_vals)
+                & (closes >= 500)
+                & (volumes >= 200000)
+            )
 
-                company_info = latest_df[latest_df['Ticker'] == ticker].iloc[0]
+            for pos in np.flatnonzero(mask):
+                ticker = latest.at[pos, 'Ticker']
+                company_info = latest_by_ticker.loc[ticker]
                 all_above_tickers.append({
                     'Ticker': ticker,
                     'Company': company_info.get('Company', ''),
                     'テーマ': company_info.get('Theme', ''),
-                    '最新の終値': latest_row['Close'],
-                    '中間値': mid_price,
-                    '短期移動平均': latest_row[short_ma],
-                    '中期移動平均': latest_row[mid_ma],
-                    '長期移動平均': latest_row[long_ma],
+                    '最新の終値': closes[pos],
+                    '中間値': mid_prices[pos],
+                    '短期移動平均': short_vals[pos],
+                    '中期移動平均': mid_vals[pos],
+                    '長期移動平均': long_vals[pos],
                 })
 
-            except Exception as e:
-                logger.warning(f"銘柄 {ticker} の処理中にエラーが発生しました: {str(e)}")
-                continue
-
         # 結果を出力
         output_file = os.path.join(output_dir, "AllAbove.csv")
 
@@ -383,9 +695,7 @@ def extract_all_above_signals(is_test_mode: bool = False) -> bool:
             all_above_df['短期移動平均'] = all_above_df['短期移動平均'].round(2)
             all_above_df['中期移動平均'] = all_above_df['中期移動平均'].round(2)
             all_above_df['長期移動平均'] = all_above_df['長期移動平均'].round(2)
-            all_above_df['最新の終値'] = all_above_df['最新の終値'].apply(
-                lambda x: int(x) if x == int(x) else round(x, 1)
-            )
+            all_above_df['最新の終値'] = _format_close(all_above_df['最新の終値'])
             all_above_df.to_csv(output_file, index=False, encoding='utf-8-sig')
             logger.info(f"AllAbove銘柄: {len(all_above_df)}件を {output_file} に出力しました")
         else:
@@ -433,14 +743,7 @@ def extract_push_mark_signals(is_test_mode: bool = False) -> bool:
 
     try:
         # 入出力ディレクトリの設定
-        if is_test_mode:
-            input_dir = os.path.join(config.TEST_DIR, "StockSignal", "TechnicalSignal")
-            output_dir = os.path.join(config.TEST_DIR, "Result")
-        else:
-            input_dir = os.path.join(config.BASE_DIR, "StockSignal", "TechnicalSignal")
-            output_dir = os.path.join(config.BASE_DIR, "StockSignal", "Result")
-
-        os.makedirs(output_dir, exist_ok=True)
+        input_dir, output_dir = _resolve_io_dirs(is_test_mode)
 
         input_file = os.path.join(input_dir, config.LATEST_SIGNAL_FILE)
         if not os.path.exists(input_file):
@@ -448,7 +751,7 @@ def extract_push_mark_signals(is_test_mode: bool = False) -> bool:
             return False
 
         logger.info(f"{input_file} を読み込みます")
-        latest_df = pd.read_csv(input_file, index_col=0, parse_dates=True)
+        latest_df = _load_latest_signal(input_file)
 
         # 移動平均線のカラム名 (MA_PERIODS = [5, 20, 60])
         short_ma = f'MA{config.MA_PERIODS[0]}'
@@ -465,72 +768,97 @@ def extract_push_mark_signals(is_test_mode: bool = False) -> bool:
         all_tickers = latest_df['Ticker'].unique()
         logger.info(f"処理対象の全銘柄数: {len(all_tickers)}")
 
-        push_mark_tickers = []
+        # Tickerをインデックスにした参照用フレームを1回だけ作る
+        # （銘柄ごとのブールフィルタ＝全行スキャンをハッシュ参照に置き換える。
+        #   drop_duplicatesで従来のiloc[0]＝先頭一致の動作を維持する）
+        latest_by_ticker = latest_df.drop_duplicates('Ticker').set_index('Ticker', drop=False)
+
+        # 各銘柄の末尾3行から判定に使う値だけを1枚のフレームに積み上げる
+        # （条件1〜6は銘柄ごとのスカラー比較ではなく、積み上げたndarrayへの
+        #   ベクトル演算で一括評価する）
+        required_cols = ['Close', 'Volume', short_ma, mid_ma, long_ma, volume_ma]
+        stacked_cols = required_cols + ['short_prev', 'short_prev2', 'mid_prev']
+        stacked_rows = []
 
         for ticker in all_tickers:
             try:
-                ticker_signal_file = os.path.join(input_dir, f"{ticker}_signal.csv")
-                if not os.path.exists(ticker_signal_file):
+                # 共有ローダー経由で末尾3行を取得
+                # （AllAbove抽出と同一実行内ならパース済みキャッシュが使われる）
+                ticker_df = _load_ticker_tail(input_dir, ticker)
+                if ticker_df is None or len(ticker_df) < 3:  # 3日以内の変動率チェックが必要
                     continue
 
-                ticker_df = pd.read_csv(ticker_signal_file, index_col=0, parse_dates=True)
-                if len(ticker_df) < 3:  # 3日以内の変動率チェックが必要
-                    continue
-
-                required_cols = ['Close', 'Volume', short_ma, mid_ma, long_ma, volume_ma]
                 if not all(col in ticker_df.columns for col in required_cols):
                     continue
 
                 latest_row = ticker_df.iloc[-1]
                 prev_row = ticker_df.iloc[-2]
+                prev2_row = ticker_df.iloc[-3]
 
-                # 条件1: 中期移動平均線が上昇中
-                condition1 = latest_row[mid_ma] > prev_row[mid_ma]
+                stacked_rows.append(
+                    (ticker,)
+                    + tuple(latest_row[col] for col in required_cols)
+                    + (prev_row[short_ma], prev2_row[short_ma], prev_row[mid_ma])
+                )
 
-                # 条件2: 終値が短期移動平均線より上
-                condition2 = latest_row['Close'] > latest_row[short_ma]
+            except Exception as e:
+                logger.warning(f"銘柄 {ticker} の処理中にエラーが発生しました: {str(e)}")
+                continue
 
-                # 条件3: 3日以内に短期移動平均線の変動率がマイナスだった日がある
-                recent_3days = ticker_df.tail(3)
-                condition3 = False
-                for i in range(1, len(recent_3days)):
-                    prev_ma = recent_3days.iloc[i-1][short_ma]
-                    curr_ma = recent_3days.iloc[i][short_ma]
-                    if prev_ma > 0:
-                        change_rate = ((curr_ma - prev_ma) / prev_ma) * 100
-                        if change_rate < 0:
-                            condition3 = True
-                            break
+        push_mark_tickers = []
 
-                # 条件4: 中期移動平均線が長期移動平均線より上
-                condition4 = latest_row[mid_ma] > latest_row[long_ma]
+        if stacked_rows:
+            stacked = pd.DataFrame(stacked_rows, columns=['Ticker'] + stacked_cols)
+
+            closes = stacked['Close'].to_numpy(dtype='float64')
+            volumes = stacked['Volume'].to_numpy(dtype='float64')
+            short_vals = stacked[short_ma].to_numpy(dtype='float64')
+            mid_vals = stacked[mid_ma].to_numpy(dtype='float64')
+            long_vals = stacked[long_ma].to_numpy(dtype='float64')
+            volume_ma_vals = stacked[volume_ma].to_numpy(dtype='float64')
+            short_prev = stacked['short_prev'].to_numpy(dtype='float64')
+            short_prev2 = stacked['short_prev2'].to_numpy(dtype='float64')
+            mid_prev = stacked['mid_prev'].to_numpy(dtype='float64')
+
+            # 条件1: 中期移動平均線が上昇中（前日より高い）
+            condition1 = mid_vals > mid_prev
+
+            # 条件2: 終値が短期移動平均線より上
+            condition2 = closes > short_vals
+
+            # 条件3: 3日以内に短期移動平均線の変動率がマイナスだった日がある
+            # （変動率 < 0 ⟺ 当日値 < 前日値。前日値が正の場合のみ判定する）
+            condition3 = (
+                ((short_prev > 0) & (short_vals < short_prev))
+                | ((short_prev2 > 0) & (short_prev < short_prev2))
+            )
 
-                # 条件5: 出来高が10万以上
-                condition5 = latest_row['Volume'] >= 100000
+            # 条件4: 中期移動平均線が長期移動平均線より上
+            condition4 = mid_vals > long_vals
 
-                # 条件6: 出来高が出来高移動平均線より多い
-                condition6 = latest_row['Volume'] > latest_row[volume_ma]
+            # 条件5: 出来高が10万以上
+            condition5 = volumes >= 100000
 
-                if not (condition1 and condition2 and condition3 and condition4 and condition5 and condition6):
-                    continue
+            # 条件6: 出来高が出来高移動平均線より多い
+            condition6 = volumes > volume_ma_vals
 
-                company_info = latest_df[latest_df['Ticker'] == ticker].iloc[0]
+            mask = condition1 & condition2 & condition3 & condition4 & condition5 & condition6
+
+            for pos in np.flatnonzero(mask):
+                ticker = stacked.at[pos, 'Ticker']
+                company_info = latest_by_ticker.loc[ticker]
                 push_mark_tickers.append({
                     'Ticker': ticker,
                     'Company': company_info.get('Company', ''),
                     'テーマ': company_info.get('Theme', ''),
-                    '最新の終値': latest_row['Close'],
-                    '短期移動平均': latest_row[short_ma],
-                    '中期移動平均': latest_row[mid_ma],
-                    '長期移動平均': latest_row[long_ma],
-                    '出来高': latest_row['Volume'],
-                    '出来高移動平均': latest_row[volume_ma],
+                    '最新の終値': closes[pos],
+                    '短期移動平均': short_vals[pos],
+                    '中期移動平均': mid_vals[pos],
+                    '長期移動平均': long_vals[pos],
+                    '出来高': volumes[pos],
+                    '出来高移動平均': volume_ma_vals[pos],
                 })
 
-            except Exception as e:
-                logger.warning(f"銘柄 {ticker} の処理中にエラーが発生しました: {str(e)}")
-                continue
-
         # 結果を出力
         output_file = os.path.join(output_dir, "push_mark.csv")
 
@@ -541,9 +869,7 @@ def extract_push_mark_signals(is_test_mode: bool = False) -> bool:
             push_mark_df['長期移動平均'] = push_mark_df['長期移動平均'].round(2)
             push_mark_df['出来高'] = push_mark_df['出来高'].round(2)
             push_mark_df['出来高移動平均'] = push_mark_df['出来高移動平均'].round(2)
-            push_mark_df['最新の終値'] = push_mark_df['最新の終値'].apply(
-                lambda x: int(x) if x == int(x) else round(x, 1)
-            )
+            push_mark_df['最新の終値'] = _format_close(push_mark_df['最新の終値'])
             push_mark_df.to_csv(output_file, index=False, encoding='utf-8-sig')
             logger.info(f"押し目銘柄: {len(push_mark_df)}件を {output_file} に出力しました")
         else:
@@ -590,10 +916,13 @@ if __name__ == "__main__":
     elif args.type == 'push_mark':
         success = extract_push_mark_signals(args.test)
     else:  # all
-        success = (
-            identify_breakouts(args.test)
-            and extract_all_above_signals(args.test)
-            and extract_push_mark_signals(args.test)
-        )
+        # 3種類の抽出は出力先が独立しているため並行実行する（main.pyと同じ方式）
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = [
+                executor.submit(identify_breakouts, args.test),
+                executor.submit(extract_all_above_signals, args.test),
+                executor.submit(extract_push_mark_signals, args.test),
+            ]
+            success = all(future.result() for future in futures)
 
     sys.exit(0 if success else 1)
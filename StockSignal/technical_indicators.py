@@ -1348,6 +1348,15 @@ def process_data_for_ticker(ticker: str, data_dir: str, output_dir: str) -> Tupl
         # すべてのデータをCSVに保存（全期間の詳細データ）
         signal_df.to_csv(output_file)
         logger.info(f"銘柄 {ticker} のテクニカル指標（全データ）を計算・保存しました")
+
+        # チャート生成などの下流処理向けにfeatherサイドカーも保存
+        # （CSVパースより大幅に高速な型付きカラムナ形式。書き込み失敗時は
+        #   CSVがあるため処理は続行する）
+        try:
+            feather_output_file = os.path.join(output_dir, f"{ticker}_signal.feather")
+            signal_df.reset_index().to_feather(feather_output_file)
+        except Exception as e:
+            logger.debug(f"銘柄 {ticker} のfeatherサイドカー保存に失敗しました: {str(e)}")
         
         # 最新の日付のデータのみを抽出（データフレームの最終行）
         # .copy()で新しいデータフレームを作成（警告回避）
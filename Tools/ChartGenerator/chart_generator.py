@@ -8,6 +8,7 @@
 import yfinance as yf
 import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
+from matplotlib.collections import LineCollection, PolyCollection
 import pandas as pd
 import numpy as np
 from datetime import datetime
@@ -152,28 +153,49 @@ class ChartGenerator:
     
     def plot_candlestick(self, ax, data, ticker, company_name):
         """ローソク足を描画"""
-        # 上昇・下降の判定
-        up = data[data['Close'] >= data['Open']]
-        down = data[data['Close'] < data['Open']]
-        
-        # 上昇時のローソク足（赤）
-        if not up.empty:
-            ax.bar(up.index, up['Close'] - up['Open'], bottom=up['Open'], 
-                   color='red', alpha=0.7, width=0.8)
-            ax.bar(up.index, up['High'] - up['Close'], bottom=up['Close'], 
-                   color='red', alpha=0.7, width=0.1)
-            ax.bar(up.index, up['Low'] - up['Open'], bottom=up['Open'], 
-                   color='red', alpha=0.7, width=0.1)
-        
-        # 下降時のローソク足（青）
-        if not down.empty:
-            ax.bar(down.index, down['Close'] - down['Open'], bottom=down['Open'], 
-                   color='blue', alpha=0.7, width=0.8)
-            ax.bar(down.index, down['High'] - down['Open'], bottom=down['Open'], 
-                   color='blue', alpha=0.7, width=0.1)
-            ax.bar(down.index, down['Low'] - down['Close'], bottom=down['Close'], 
-                   color='blue', alpha=0.7, width=0.1)
-        
+        # ax.barは1本ごとにRectangleパッチを生成するため、本数×銘柄数では
+        # Python側のオーバーヘッドが支配的になる。実体（胴体）は
+        # PolyCollection、ヒゲはLineCollectionにまとめてNumPy配列から
+        # 一括構築する（add_collection 3回で全ローソク足を描画）
+        x = mdates.date2num(data.index.to_pydatetime())
+        opens = data['Open'].to_numpy(dtype='float64')
+        highs = data['High'].to_numpy(dtype='float64')
+        lows = data['Low'].to_numpy(dtype='float64')
+        closes = data['Close'].to_numpy(dtype='float64')
+
+        # 上昇・下降の判定（ベクトル比較1回）
+        up = closes >= opens
+        half_width = 0.4
+
+        # 胴体の矩形頂点を(N, 4, 2)配列で構築
+        left = x - half_width
+        right = x + half_width
+        body_low = np.minimum(opens, closes)
+        body_high = np.maximum(opens, closes)
+        verts = np.stack([
+            np.stack([left, body_low], axis=1),
+            np.stack([left, body_high], axis=1),
+            np.stack([right, body_high], axis=1),
+            np.stack([right, body_low], axis=1),
+        ], axis=1)
+
+        if up.any():
+            ax.add_collection(PolyCollection(verts[up], facecolors='red', alpha=0.7))
+        if (~up).any():
+            ax.add_collection(PolyCollection(verts[~up], facecolors='blue', alpha=0.7))
+
+        # ヒゲは高値から安値までの縦線を(N, 2, 2)セグメントで一括描画
+        wick_segments = np.stack([
+            np.stack([x, lows], axis=1),
+            np.stack([x, highs], axis=1),
+        ], axis=1)
+        wick_colors = np.where(up, 'red', 'blue')
+        ax.add_collection(LineCollection(wick_segments, colors=wick_colors,
+                                         linewidths=0.8, alpha=0.7, zorder=0))
+
+        # add_collectionは自動スケールを更新しないため明示的に再計算
+        ax.autoscale_view()
+
         ax.set_title(f'{ticker} - {company_name} Stock Price Chart', fontsize=16, fontweight='bold')
         ax.set_ylabel('Price (JPY)', fontsize=12)
         ax.grid(True, alpha=0.3)